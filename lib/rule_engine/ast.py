@@ -33,6 +33,7 @@
 import collections
 import collections.abc
 import datetime
+import decimal
 import functools
 import operator
 import re
@@ -42,6 +43,34 @@ from .parser.utilities import parse_datetime, parse_float, parse_timedelta
 from .suggestions import suggest_symbol
 from .types import *
 
+# regexes from symbols are compiled on every evaluation, so cache them by (pattern, flags) in front of re's own cache
+_compile_regex = functools.lru_cache(maxsize=512)(re.compile)
+
+# values of these types are already loaded, they need neither coercion nor a timezone
+_native_value_types = frozenset((bool, bytes, decimal.Decimal, str, type(None)))
+
+def _literal_regex_matcher(regex, regex_function, flags):
+	# patterns which are just literal text, optionally anchored, can be checked with string methods instead
+	if flags:
+		return None
+	anchored_start = regex_function == 'match'
+	if regex.startswith('^'):
+		regex = regex[1:]
+		anchored_start = True
+	anchored_end = regex.endswith('$')
+	if anchored_end:
+		regex = regex[:-1]
+	if re.escape(regex) != regex:
+		return None
+	# $ also matches before a trailing newline
+	if anchored_start and anchored_end:
+		return (regex, regex + '\n').__contains__
+	elif anchored_start:
+		return lambda value: value.startswith(regex)
+	elif anchored_end:
+		return lambda value: value.endswith((regex, regex + '\n'))
+	return lambda value: regex in value
+
 def _assert_is_bytes(*values):
 	if not all(map(isinstance, values, [bytes])):
 		raise errors.EvaluationError('data type mismatch (not a bytes value)')
@@ -70,6 +99,58 @@ def _is_reduced(*values):
 	"""
 	return all((isinstance(value, LiteralExpressionBase) and value.is_reduced) for value in values)
 
+def _defined_by(cls, name):
+	"""Get the class from the method resolution order of *cls* that defines the *name* attribute."""
+	for klass in cls.__mro__:
+		if name in vars(klass):
+			return klass
+	return None
+
+# the operator semantics are implemented once by these functions, the _op_ methods call them and nodes that can be
+# specialized bind them to their operands with functools.partial
+def _evaluate_arithmetic(op, left_evaluate, right_evaluate, thing):
+	left_value = left_evaluate(thing)
+	_assert_is_numeric(left_value)
+	right_value = right_evaluate(thing)
+	_assert_is_numeric(right_value)
+	return op(left_value, right_value)
+
+def _evaluate_and(left_evaluate, right_evaluate, thing):
+	return bool(left_evaluate(thing) and right_evaluate(thing))
+
+def _evaluate_or(left_evaluate, right_evaluate, thing):
+	return bool(left_evaluate(thing) or right_evaluate(thing))
+
+def _evaluate_unary(op, right_evaluate, thing):
+	return op(right_evaluate(thing))
+
+def _evaluate_right_constant(compare, left_evaluate, right_value, thing):
+	return compare(left_evaluate(thing), right_value)
+
+def _compare_eq(left_value, right_value):
+	# values of different types are never equal
+	return type(left_value) is type(right_value) and left_value == right_value
+
+def _compare_ne(left_value, right_value):
+	return type(left_value) is not type(right_value) or left_value != right_value
+
+def _compare_arithmetic(op, left_value, right_value):
+	if left_value is None and right_value is None:
+		return op in (operator.ge, operator.le)
+	elif isinstance(left_value, tuple) and isinstance(right_value, tuple):
+		return _compare_arithmetic_arrays(op, left_value, right_value)
+	elif type(left_value) is not type(right_value):
+		raise errors.EvaluationError('data type mismatch')
+	return op(left_value, right_value)
+
+def _compare_arithmetic_arrays(op, left_value, right_value):
+	for subleft_value, subright_value in zip(left_value, right_value):
+		if _compare_arithmetic(operator.ne, subleft_value, subright_value):
+			return _compare_arithmetic(op, subleft_value, subright_value)
+	if len(left_value) != len(right_value):
+		return _compare_arithmetic(op, len(left_value), len(right_value))
+	return op in (operator.ge, operator.le)
+
 def _iterable_member_value_type(value):
 	value = (
 		member.result_type if isinstance(member, ExpressionBase) else member for member in value
@@ -143,9 +224,11 @@ class ExpressionBase(ASTNodeBase):
 	def __repr__(self):
 		return "<{0} >".format(self.__class__.__name__)
 
-	def _new_value(self, *args, **kwargs):
+	def _new_value(self, value, verify_type=True):
 		# perform a context aware load of value
-		value = coerce_value(*args, **kwargs)
+		if type(value) in _native_value_types:
+			return value
+		value = coerce_value(value, verify_type=verify_type)
 		if isinstance(value, datetime.datetime) and value.tzinfo is None:
 			value = value.replace(tzinfo=self.context.default_timezone)
 		return value
@@ -161,7 +244,9 @@ class LiteralExpressionBase(ExpressionBase):
 		:param value: The native Python value.
 		"""
 		self.context = context
-		if self.result_type.is_scalar and DataType.from_value(value) != self.result_type:
+		result_type = self.result_type
+		# literals from the parser are already of the exact python type, so only other values need to be checked
+		if result_type.is_scalar and type(value) is not result_type.python_type and DataType.from_value(value) != result_type:
 			raise TypeError("__init__ argument 2 must be {}, not {}".format(self.result_type.python_type.__name__, type(value).__name__))
 		self.value = value
 
@@ -180,6 +265,11 @@ class LiteralExpressionBase(ExpressionBase):
 		:param value: The value to represent as a Literal Expression.
 		:return: A subclass of :py:class:`~.LiteralExpressionBase` specific to the type of *value*.
 		"""
+		if cls is LiteralExpressionBase:
+			# values folded from a reduced expression are native scalars, so these don't need to search the subclasses
+			subclass = _scalar_literal_expressions.get(type(value))
+			if subclass is not None:
+				return subclass(context, value)
 		datatype = DataType.from_value(value)
 		for subclass in cls.__subclasses__():
 			if DataType.is_compatible(subclass.result_type, datatype):
@@ -267,7 +357,8 @@ class FloatExpression(LiteralExpressionBase):
 	"""Literal float expressions representing numerical values."""
 	result_type = DataType.FLOAT
 	def __init__(self, context, value, **kwargs):
-		value = coerce_value(value)
+		if type(value) is not decimal.Decimal:
+			value = coerce_value(value)
 		super(FloatExpression, self).__init__(context, value, **kwargs)
 
 	@classmethod
@@ -340,6 +431,17 @@ class StringExpression(LiteralExpressionBase):
 	"""Literal string expressions representing an array of characters."""
 	result_type = DataType.STRING
 
+# the literal expression classes for the native python types that map to exactly one of them
+_scalar_literal_expressions = {
+	bool: BooleanExpression,
+	bytes: BytesExpression,
+	datetime.datetime: DatetimeExpression,
+	datetime.timedelta: TimedeltaExpression,
+	decimal.Decimal: FloatExpression,
+	str: StringExpression,
+	type(None): NullExpression
+}
+
 ################################################################################
 # Left-Operator-Right Expressions
 ################################################################################
@@ -372,6 +474,9 @@ class LeftOperatorRightExpressionBase(ExpressionBase):
 		self._evaluator = getattr(self, '_op_' + type_, None)
 		if self._evaluator is None:
 			raise errors.EngineError('unsupported operator: ' + type_)
+		if self.__class__.evaluate is LeftOperatorRightExpressionBase.evaluate:
+			# bind the operator method directly to skip a level of dispatch each time this node is evaluated
+			self.evaluate = self._evaluator
 		self._assert_type_is_compatible(left)
 		self.left = left
 		self._assert_type_is_compatible(right)
@@ -489,12 +594,20 @@ class ArithmeticExpression(LeftOperatorRightExpressionBase):
 	"""A class for representing arithmetic expressions from the grammar text such as multiplication and division."""
 	compatible_types = (DataType.FLOAT,)
 	result_type = DataType.FLOAT
+	_operators = {
+		'fdiv': operator.floordiv,
+		'tdiv': operator.truediv,
+		'mod': operator.mod,
+		'mul': operator.mul,
+		'pow': operator.pow
+	}
+	def __init__(self, *args, **kwargs):
+		super(ArithmeticExpression, self).__init__(*args, **kwargs)
+		if self.__class__.evaluate is LeftOperatorRightExpressionBase.evaluate and _defined_by(self.__class__, '_op_' + self.type) is ArithmeticExpression:
+			self.evaluate = functools.partial(_evaluate_arithmetic, self._operators[self.type], self.left.evaluate, self.right.evaluate)
+
 	def __op_arithmetic(self, op, thing):
-		left_value = self.left.evaluate(thing)
-		_assert_is_numeric(left_value)
-		right_value = self.right.evaluate(thing)
-		_assert_is_numeric(right_value)
-		return op(left_value, right_value)
+		return _evaluate_arithmetic(op, self.left.evaluate, self.right.evaluate, thing)
 
 	_op_fdiv = functools.partialmethod(__op_arithmetic, operator.floordiv)
 	_op_tdiv = functools.partialmethod(__op_arithmetic, operator.truediv)
@@ -559,30 +672,60 @@ class BitwiseShiftExpression(BitwiseExpression):
 
 class LogicExpression(LeftOperatorRightExpressionBase):
 	"""A class for representing logical expressions from the grammar text such as "and" and "or"."""
+	def __init__(self, *args, **kwargs):
+		super(LogicExpression, self).__init__(*args, **kwargs)
+		if self.__class__.evaluate is LeftOperatorRightExpressionBase.evaluate and _defined_by(self.__class__, '_op_' + self.type) is LogicExpression:
+			# these join the other expressions of most rules, so bind the operands to skip looking them up
+			self.evaluate = functools.partial(_evaluate_or if self.type == 'or' else _evaluate_and, self.left.evaluate, self.right.evaluate)
+
+	def reduce(self):
+		if _is_reduced(self.left, self.right):
+			return super(LogicExpression, self).reduce()
+		is_or = self.type == 'or'
+		if _is_reduced(self.left):
+			# the literal either decides the result or leaves it to the other side alone
+			if bool(self.left.evaluate(None)) is is_or:
+				return BooleanExpression(self.context, is_or)
+			if _returns_bool(self.right):
+				return self.right
+		elif _is_reduced(self.right):
+			# the left side must still be evaluated, so it can only be used in place of this expression
+			if bool(self.right.evaluate(None)) is not is_or and _returns_bool(self.left):
+				return self.left
+		return self
+
 	def _op_and(self, thing):
-		return bool(self.left.evaluate(thing) and self.right.evaluate(thing))
+		return _evaluate_and(self.left.evaluate, self.right.evaluate, thing)
 
 	def _op_or(self, thing):
-		return bool(self.left.evaluate(thing) or self.right.evaluate(thing))
+		return _evaluate_or(self.left.evaluate, self.right.evaluate, thing)
 
 ################################################################################
 # Left-Operator-Right Comparison Expressions
 ################################################################################
 class ComparisonExpression(LeftOperatorRightExpressionBase):
 	"""A class for representing comparison expressions from the grammar text such as equality checks."""
-	def _op_eq(self, thing):
-		left_value = self.left.evaluate(thing)
-		right_value = self.right.evaluate(thing)
-		if type(left_value) is not type(right_value):
+	def __init__(self, *args, **kwargs):
+		super(ComparisonExpression, self).__init__(*args, **kwargs)
+		if self.type in ('eq', 'ne') and self._is_specializable(ComparisonExpression):
+			self.evaluate = self._specialize_right_constant(_compare_ne if self.type == 'ne' else _compare_eq)
+
+	def _is_specializable(self, owner):
+		# comparisons against a constant scalar (e.g. "name == 'Luke'") are the most common and can be partially evaluated
+		if self.__class__.evaluate is not LeftOperatorRightExpressionBase.evaluate:
+			return False
+		if _defined_by(self.__class__, '_op_' + self.type) is not owner:
 			return False
-		return operator.eq(left_value, right_value)
+		return _is_reduced(self.right) and self.right.result_type.is_scalar
+
+	def _specialize_right_constant(self, compare):
+		return functools.partial(_evaluate_right_constant, compare, self.left.evaluate, self.right.value)
+
+	def _op_eq(self, thing):
+		return _compare_eq(self.left.evaluate(thing), self.right.evaluate(thing))
 
 	def _op_ne(self, thing):
-		left_value = self.left.evaluate(thing)
-		right_value = self.right.evaluate(thing)
-		if type(left_value) is not type(right_value):
-			return True
-		return operator.ne(left_value, right_value)
+		return _compare_ne(self.left.evaluate(thing), self.right.evaluate(thing))
 
 class ArithmeticComparisonExpression(ComparisonExpression):
 	"""
@@ -595,28 +738,11 @@ class ArithmeticComparisonExpression(ComparisonExpression):
 		if self.left.result_type != DataType.UNDEFINED and self.right.result_type != DataType.UNDEFINED:
 			if self.left.result_type != self.right.result_type:
 				raise errors.EvaluationError('data type mismatch')
+		if self.type in ('ge', 'gt', 'le', 'lt') and self._is_specializable(ArithmeticComparisonExpression):
+			self.evaluate = self._specialize_right_constant(functools.partial(_compare_arithmetic, getattr(operator, self.type)))
 
 	def __op_arithmetic(self, op, thing):
-		left_value = self.left.evaluate(thing)
-		right_value = self.right.evaluate(thing)
-		return self.__op_arithmetic_values(op, left_value, right_value)
-
-	def __op_arithmetic_arrays(self, op, left_value, right_value):
-		for subleft_value, subright_value in zip(left_value, right_value):
-			if self.__op_arithmetic_values(operator.ne, subleft_value, subright_value):
-				return self.__op_arithmetic_values(op, subleft_value, subright_value)
-		if len(left_value) != len(right_value):
-			return self.__op_arithmetic_values(op, len(left_value), len(right_value))
-		return op in (operator.ge, operator.le)
-
-	def __op_arithmetic_values(self, op, left_value, right_value):
-		if left_value is None and right_value is None:
-			return op in (operator.ge, operator.le)
-		elif isinstance(left_value, tuple) and isinstance(right_value, tuple):
-			return self.__op_arithmetic_arrays(op, left_value, right_value)
-		elif type(left_value) is not type(right_value):
-			raise errors.EvaluationError('data type mismatch')
-		return op(left_value, right_value)
+		return _compare_arithmetic(op, self.left.evaluate(thing), self.right.evaluate(thing))
 
 	_op_ge = functools.partialmethod(__op_arithmetic, operator.ge)
 	_op_gt = functools.partialmethod(__op_arithmetic, operator.gt)
@@ -633,10 +759,46 @@ class FuzzyComparisonExpression(ComparisonExpression):
 		super(FuzzyComparisonExpression, self).__init__(*args, **kwargs)
 		if isinstance(self.right, StringExpression):
 			self._right = self._compile_regex(self.right.evaluate(None))
+			if self.__class__.evaluate is LeftOperatorRightExpressionBase.evaluate and _defined_by(self.__class__, '_op_' + self.type) is FuzzyComparisonExpression:
+				# the pattern is fixed, so bind its match or search method directly
+				self.evaluate = self._specialize_regex('search' if self.type.endswith('_fzs') else 'match', self.type.startswith('ne_'))
+
+	def _specialize_regex(self, regex_function, negate):
+		left_evaluate = self.left.evaluate
+		regex_method = getattr(self._right, regex_function)
+		context = self.context
+		literal_matcher = _literal_regex_matcher(self._right.pattern, regex_function, self._right.flags & ~re.UNICODE)
+		if literal_matcher is not None:
+			def evaluate(thing):
+				left = left_evaluate(thing)
+				if left is None:
+					return negate
+				if not isinstance(left, str):
+					raise errors.EvaluationError('data type mismatch')
+				if not literal_matcher(left):
+					return negate
+				# a literal pattern has no groups
+				context._tls.regex_groups = ()
+				return not negate
+			return evaluate
+
+		def evaluate(thing):
+			left = left_evaluate(thing)
+			if left is None:
+				return negate
+			if not isinstance(left, str):
+				raise errors.EvaluationError('data type mismatch')
+			match = regex_method(left)
+			if match is None:
+				return negate
+			# the groups are always strings or None, so they're valid without being coerced
+			context._tls.regex_groups = match.groups()
+			return not negate
+		return evaluate
 
 	def _compile_regex(self, regex):
 		try:
-			result = re.compile(regex, flags=self.context.regex_flags)
+			result = _compile_regex(regex, self.context.regex_flags)
 		except re.error as error:
 			raise errors.RegexSyntaxError('invalid regular expression', error=error, value=regex) from None
 		return result
@@ -657,7 +819,7 @@ class FuzzyComparisonExpression(ComparisonExpression):
 			return not modifier(left, regex)
 		match = getattr(regex, regex_function)(left)
 		if match is not None:
-			self.context._tls.regex_groups = coerce_value(match.groups())
+			self.context._tls.regex_groups = match.groups()
 		return modifier(match, None)
 
 	_op_eq_fzm = functools.partialmethod(__op_regex, 'match', operator.is_not)
@@ -665,6 +827,10 @@ class FuzzyComparisonExpression(ComparisonExpression):
 	_op_ne_fzm = functools.partialmethod(__op_regex, 'match', operator.is_)
 	_op_ne_fzs = functools.partialmethod(__op_regex, 'search', operator.is_)
 
+def _returns_bool(expression):
+	# a BOOLEAN result type isn't enough because typed symbols may still be null, these always evaluate to a bool
+	return isinstance(expression, (ComparisonExpression, ContainsExpression, LogicExpression))
+
 ################################################################################
 # Miscellaneous Expressions
 ################################################################################
@@ -759,7 +925,7 @@ class ContainsExpression(ExpressionBase):
 
 class GetAttributeExpression(ExpressionBase):
 	"""A class representing an expression in which *name* is retrieved as an attribute of *object*."""
-	__slots__ = ('name', 'object', 'safe')
+	__slots__ = ('name', 'object', 'safe', '_key_type')
 	def __init__(self, context, object_, name, safe=False):
 		"""
 		:param context: The context to use for evaluating the expression.
@@ -784,6 +950,7 @@ class GetAttributeExpression(ExpressionBase):
 					# leave the result type undefined because the name could be a mapping key or attribute
 		self.name = name
 		self.safe = safe
+		self._key_type = None
 
 	@classmethod
 	def build(cls, context, object_, name, safe=False):
@@ -798,16 +965,25 @@ class GetAttributeExpression(ExpressionBase):
 			return resolved_obj
 
 		attribute_error = None
-		try:
-			value = self.context.resolve_attribute(thing, resolved_obj, self.name)
-		except errors.AttributeResolutionError as error:
-			attribute_error = error
-		else:
-			return self._new_value(value, verify_type=False)
+		resolved_type = type(resolved_obj)
+		if resolved_type is not self._key_type:
+			try:
+				value = self.context.resolve_attribute(thing, resolved_obj, self.name)
+			except errors.AttributeResolutionError as error:
+				attribute_error = error
+			else:
+				return self._new_value(value, verify_type=False)
 
 		try:
 			value = self.context.resolve(resolved_obj, self.name)
 		except errors.SymbolResolutionError as symbol_error:
+			if attribute_error is None:
+				# the attribute resolution was skipped, so it needs to be tried now
+				self._key_type = None
+				try:
+					return self._new_value(self.context.resolve_attribute(thing, resolved_obj, self.name), verify_type=False)
+				except errors.AttributeResolutionError as error:
+					attribute_error = error
 			default_value = self.context.default_value
 			if default_value is errors.UNDEFINED:
 				suggestion = attribute_error.suggestion or symbol_error.suggestion
@@ -817,6 +993,9 @@ class GetAttributeExpression(ExpressionBase):
 				attribute_error.suggestion = suggestion
 				raise attribute_error from None
 			value = default_value
+		else:
+			# the name is a key of objects of this type (e.g. a MAPPING), so skip straight to resolving it next time
+			self._key_type = resolved_type
 		return self._new_value(value, verify_type=False)
 
 	def reduce(self):
@@ -1013,10 +1192,45 @@ class SymbolExpression(ExpressionBase):
 		if type_hint is not None:
 			self.result_type = type_hint
 		self.scope = scope
+		if self.__class__.evaluate is SymbolExpression.evaluate:
+			if self.result_type is DataType.UNDEFINED:
+				# without a type hint there's nothing to check, so bind the resolution steps into a closure
+				self.evaluate = self._specialize_untyped()
+			elif self.result_type.is_scalar:
+				self.evaluate = self._specialize_scalar()
 
 	def __repr__(self):
 		return "<{0} name={1!r} >".format(self.__class__.__name__, self.name)
 
+	def _specialize_untyped(self):
+		context = self.context
+		resolve = context.resolve
+		name = self.name
+		scope = self.scope
+		new_value = self._new_value
+		def evaluate(thing):
+			try:
+				value = resolve(thing, name, scope=scope)
+			except errors.SymbolResolutionError:
+				default_value = context.default_value
+				if default_value is errors.UNDEFINED:
+					raise
+				value = default_value
+			return new_value(value, verify_type=False)
+		return evaluate
+
+	def _specialize_scalar(self):
+		load = self._specialize_untyped()
+		python_type = self.result_type.python_type
+		check_value = self._check_value
+		def evaluate(thing):
+			value = load(thing)
+			# a value of exactly the hinted type (or null) is always valid, so the full check is only needed otherwise
+			if type(value) is python_type or value is None:
+				return value
+			return check_value(value)
+		return evaluate
+
 	def evaluate(self, thing):
 		try:
 			value = self.context.resolve(thing, self.name, scope=self.scope)
@@ -1028,9 +1242,11 @@ class SymbolExpression(ExpressionBase):
 		value = self._new_value(value, verify_type=False)
 
 		# if the expected result type is undefined, return the value
-		if self.result_type == DataType.UNDEFINED:
+		if self.result_type is DataType.UNDEFINED:
 			return value
+		return self._check_value(value)
 
+	def _check_value(self, value):
 		# use DataType.from_value to raise a TypeError if value is not of a
 		# compatible data type
 		value_type = DataType.from_value(value)
@@ -1146,6 +1362,9 @@ class Statement(ASTNodeBase):
 		self.context = context
 		self.expression = expression
 		self.comment = comment
+		if self.__class__.evaluate is Statement.evaluate:
+			# the statement only wraps the expression, so evaluate it directly
+			self.evaluate = expression.evaluate
 
 	@classmethod
 	def build(cls, context, expression, **kwargs):
@@ -1231,6 +1450,11 @@ class UnaryExpression(ExpressionBase):
 			raise ValueError('unknown unary expression type')
 		self._evaluator = getattr(self, '_op_' + type_)
 		self.right = right
+		if self.__class__.evaluate is UnaryExpression.evaluate:
+			if type_ == 'not' and _defined_by(self.__class__, '_op_not') is UnaryExpression:
+				self.evaluate = functools.partial(_evaluate_unary, operator.not_, right.evaluate)
+			else:
+				self.evaluate = self._evaluator
 
 	@classmethod
 	def build(cls, context, type_, right):
@@ -1243,7 +1467,7 @@ class UnaryExpression(ExpressionBase):
 		return self._evaluator(thing)
 
 	def __op(self, op, thing):
-		return op(self.right.evaluate(thing))
+		return _evaluate_unary(op, self.right.evaluate, thing)
 
 	_op_not = functools.partialmethod(__op, operator.not_)
 
@@ -98,11 +98,72 @@ class BuiltinValueGenerator(object):
 	def __call__(self, builtins):
 		return self.callable(builtins)
 
+def _builtin_now(builtins):
+	return datetime.datetime.now(tz=builtins.timezone)
+
+def _builtin_today(builtins):
+	return _builtin_now(builtins).replace(hour=0, minute=0, second=0, microsecond=0)
+
+# the defaults are immutable so they're built once and copied by Builtins.from_defaults
+# there may be errors here if the decimal.Context precision exceeds what is provided by the math constants
+_default_values = {
+	# mathematical constants
+	'e': decimal.Decimal(repr(math.e)),
+	'pi': decimal.Decimal(repr(math.pi)),
+	# timestamps
+	'now': BuiltinValueGenerator(_builtin_now),
+	'today': BuiltinValueGenerator(_builtin_today),
+	# functions
+	'abs': abs,
+	'any': any,
+	'all': all,
+	'sum': sum,
+	'map': _builtin_map,
+	'max': max,
+	'min': min,
+	'filter': _builtin_filter,
+	'parse_datetime': BuiltinValueGenerator(lambda builtins: functools.partial(_builtin_parse_datetime, builtins)),
+	'parse_float': parse_float,
+	'parse_timedelta': parse_timedelta,
+	'random': _builtin_random,
+	'range': _builtin_range,
+	'split': _builtins_split
+}
+_default_value_types = {
+	# mathematical constants
+	'e': ast.DataType.FLOAT,
+	'pi': ast.DataType.FLOAT,
+	# timestamps
+	'now': ast.DataType.DATETIME,
+	'today': ast.DataType.DATETIME,
+	# functions
+	'abs': ast.DataType.FUNCTION('abs', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.FLOAT,)),
+	'all': ast.DataType.FUNCTION('all', return_type=ast.DataType.BOOLEAN, argument_types=(ast.DataType.ARRAY,)),
+	'any': ast.DataType.FUNCTION('any', return_type=ast.DataType.BOOLEAN, argument_types=(ast.DataType.ARRAY,)),
+	'sum': ast.DataType.FUNCTION('sum', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.ARRAY(ast.DataType.FLOAT),)),
+	'map': ast.DataType.FUNCTION('map', return_type=ast.DataType.ARRAY, argument_types=(ast.DataType.FUNCTION, ast.DataType.ARRAY)),
+	'max': ast.DataType.FUNCTION('max', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.ARRAY(ast.DataType.FLOAT),)),
+	'min': ast.DataType.FUNCTION('min', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.ARRAY(ast.DataType.FLOAT),)),
+	'filter': ast.DataType.FUNCTION('filter', return_type=ast.DataType.ARRAY, argument_types=(ast.DataType.FUNCTION, ast.DataType.ARRAY)),
+	'parse_datetime': ast.DataType.FUNCTION('parse_datetime', return_type=ast.DataType.DATETIME, argument_types=(ast.DataType.STRING,)),
+	'parse_float': ast.DataType.FUNCTION('parse_float', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.STRING,)),
+	'parse_timedelta': ast.DataType.FUNCTION('parse_timedelta', return_type=ast.DataType.TIMEDELTA, argument_types=(ast.DataType.STRING,)),
+	'random': ast.DataType.FUNCTION('random', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.FLOAT,), minimum_arguments=0),
+	'range': ast.DataType.FUNCTION('range', return_type=ast.DataType.ARRAY(ast.DataType.FLOAT), argument_types=(ast.DataType.FLOAT, ast.DataType.FLOAT, ast.DataType.FLOAT,), minimum_arguments=1),
+	'split': ast.DataType.FUNCTION(
+		'split',
+		return_type=ast.DataType.ARRAY(ast.DataType.STRING),
+		argument_types=(ast.DataType.STRING, ast.DataType.STRING, ast.DataType.FLOAT),
+		minimum_arguments=1
+	)
+}
+
 class Builtins(collections.abc.Mapping):
 	"""
 	A class to define and provide variables to within the builtin context of rules. These can be accessed by specifying
 	a symbol name with the ``$`` prefix.
 	"""
+	__slots__ = ('__values', '__value_types', '__namespaces', 'namespace', 'timezone', '__weakref__')
 	scope_name = 'built-in'
 	"""The identity name of the scope for builtin symbols."""
 	def __init__(self, values, namespace=None, timezone=None, value_types=None):
@@ -120,6 +181,7 @@ class Builtins(collections.abc.Mapping):
 		"""
 		self.__values = values
 		self.__value_types = value_types or {}
+		self.__namespaces = {}
 		self.namespace = namespace
 		self.timezone = timezone or dateutil.tz.tzlocal()
 
@@ -138,11 +200,16 @@ class Builtins(collections.abc.Mapping):
 	def __getitem__(self, name):
 		value = self.__values[name]
 		if isinstance(value, collections.abc.Mapping):
+			# reuse the nested instance for as long as it still wraps the same values with the same timezone
+			builtins = self.__namespaces.get(name)
+			if builtins is not None and builtins.__values is value and builtins.timezone is self.timezone:
+				return builtins
 			if self.namespace is None:
 				namespace = name
 			else:
 				namespace = self.namespace + '.' + name
-			return self.__class__(value, namespace=namespace, timezone=self.timezone)
+			builtins = self.__namespaces[name] = self.__class__(value, namespace=namespace, timezone=self.timezone)
+			return builtins
 		elif callable(value) and isinstance(value, BuiltinValueGenerator):
 			value = value(self)
 		return value
@@ -156,59 +223,8 @@ class Builtins(collections.abc.Mapping):
 	@classmethod
 	def from_defaults(cls, values=None, **kwargs):
 		"""Initialize a :py:class:`Builtins` instance with a set of default values."""
-		now = BuiltinValueGenerator(lambda builtins: datetime.datetime.now(tz=builtins.timezone))
-		# there may be errors here if the decimal.Context precision exceeds what is provided by the math constants
-		default_values = {
-			# mathematical constants
-			'e': decimal.Decimal(repr(math.e)),
-			'pi': decimal.Decimal(repr(math.pi)),
-			# timestamps
-			'now': now,
-			'today': BuiltinValueGenerator(lambda builtins: now(builtins).replace(hour=0, minute=0, second=0, microsecond=0)),
-			# functions
-			'abs': abs,
-			'any': any,
-			'all': all,
-			'sum': sum,
-			'map': _builtin_map,
-			'max': max,
-			'min': min,
-			'filter': _builtin_filter,
-			'parse_datetime': BuiltinValueGenerator(lambda builtins: functools.partial(_builtin_parse_datetime, builtins)),
-			'parse_float': parse_float,
-			'parse_timedelta': parse_timedelta,
-			'random': _builtin_random,
-			'range': _builtin_range,
-			'split': _builtins_split
-		}
+		default_values = _default_values.copy()
 		default_values.update(values or {})
-		default_value_types = {
-			# mathematical constants
-			'e': ast.DataType.FLOAT,
-			'pi': ast.DataType.FLOAT,
-			# timestamps
-			'now': ast.DataType.DATETIME,
-			'today': ast.DataType.DATETIME,
-			# functions
-			'abs': ast.DataType.FUNCTION('abs', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.FLOAT,)),
-			'all': ast.DataType.FUNCTION('all', return_type=ast.DataType.BOOLEAN, argument_types=(ast.DataType.ARRAY,)),
-			'any': ast.DataType.FUNCTION('any', return_type=ast.DataType.BOOLEAN, argument_types=(ast.DataType.ARRAY,)),
-			'sum': ast.DataType.FUNCTION('sum', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.ARRAY(ast.DataType.FLOAT),)),
-			'map': ast.DataType.FUNCTION('map', return_type=ast.DataType.ARRAY, argument_types=(ast.DataType.FUNCTION, ast.DataType.ARRAY)),
-			'max': ast.DataType.FUNCTION('max', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.ARRAY(ast.DataType.FLOAT),)),
-			'min': ast.DataType.FUNCTION('min', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.ARRAY(ast.DataType.FLOAT),)),
-			'filter': ast.DataType.FUNCTION('filter', return_type=ast.DataType.ARRAY, argument_types=(ast.DataType.FUNCTION, ast.DataType.ARRAY)),
-			'parse_datetime': ast.DataType.FUNCTION('parse_datetime', return_type=ast.DataType.DATETIME, argument_types=(ast.DataType.STRING,)),
-			'parse_float': ast.DataType.FUNCTION('parse_float', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.STRING,)),
-			'parse_timedelta': ast.DataType.FUNCTION('parse_timedelta', return_type=ast.DataType.TIMEDELTA, argument_types=(ast.DataType.STRING,)),
-			'random': ast.DataType.FUNCTION('random', return_type=ast.DataType.FLOAT, argument_types=(ast.DataType.FLOAT,), minimum_arguments=0),
-			'range': ast.DataType.FUNCTION('range', return_type=ast.DataType.ARRAY(ast.DataType.FLOAT), argument_types=(ast.DataType.FLOAT, ast.DataType.FLOAT, ast.DataType.FLOAT,), minimum_arguments=1),
-			'split': ast.DataType.FUNCTION(
-				'split',
-				return_type=ast.DataType.ARRAY(ast.DataType.STRING),
-				argument_types=(ast.DataType.STRING, ast.DataType.STRING, ast.DataType.FLOAT),
-				minimum_arguments=1
-			)
-		}
+		default_value_types = _default_value_types.copy()
 		default_value_types.update(kwargs.pop('value_types', {}))
 		return cls(default_values, value_types=default_value_types, **kwargs)
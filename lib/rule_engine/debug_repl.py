@@ -31,13 +31,12 @@
 #
 
 import argparse
-import code
+import functools
 import io
 import os
-import pprint
 import re
+import reprlib
 import sys
-import textwrap
 import traceback
 
 from . import __version__
@@ -52,7 +51,95 @@ def _console_interact(console, *args, **kwargs):
 	except SystemExit:
 		if 'exitmsg' in kwargs:
 			print(kwargs['exitmsg'])
-	sys.stdin = io.TextIOWrapper(io.BufferedReader(io.FileIO(stdin, mode='rb', closefd=False)))
+	if sys.stdin.closed:
+		sys.stdin = io.TextIOWrapper(io.BufferedReader(io.FileIO(stdin, mode='rb', closefd=False)))
+	else:
+		# keep the original object so any input that has already been buffered is not lost
+		os.close(stdin)
+
+_debug_directive_regex = re.compile(r'\s*#!\s*debug\s*=\s*(\w+)')
+
+class _TruncatedRepr(reprlib.Repr):
+	def __init__(self, maxsize=100):
+		super(_TruncatedRepr, self).__init__()
+		self.maxdict = self.maxlist = self.maxset = self.maxtuple = maxsize
+		self.maxother = self.maxstring = maxsize
+
+	def repr_OrderedDict(self, obj, level):
+		# MAPPING values are returned as OrderedDict instances
+		return self.repr_dict(obj, level)
+
+def _file_key(file_h):
+	# identify the file by its name and the state of its contents so changes are detected
+	stat = os.fstat(file_h.fileno())
+	return (file_h.name, stat.st_mtime_ns, stat.st_size)
+
+_edit_file_states = {}
+_compiled_files = {}
+def _compile_file(file_h):
+	import code
+	# cache the code object by the file's identity so it's only compiled again when the file changes
+	key = _file_key(file_h)
+	compiled = _compiled_files.get(key)
+	if compiled is None:
+		compiled = _compiled_files[key] = code.compile_command(file_h.read(), filename=file_h.name, symbol='exec')
+	return compiled
+
+def _load_history(history_file):
+	try:
+		import readline
+	except ImportError:
+		# readline is not available on all platforms
+		return False
+	readline.clear_history()
+	try:
+		readline.read_history_file(history_file)
+	except OSError:
+		pass
+	readline.set_history_length(1000)
+	return True
+
+def _save_history(history_file):
+	import readline
+	try:
+		readline.write_history_file(history_file)
+	except OSError:
+		pass
+
+def _format_exception(error, chain=True):
+	return ''.join(traceback.format_exception(error.__class__, error, error.__traceback__, chain=chain))
+
+def _handle_function_call_error(error, debugging):
+	lines = ["  Function:  {!r}".format(error.function_name)]
+	if debugging and error.error:
+		import textwrap
+		lines.append(textwrap.indent(_format_exception(error.error), ' ' * 4))
+	return lines
+
+def _handle_regex_syntax_error(error, debugging):
+	return [
+		"  Regex:   {!r}".format(error.error.pattern),
+		"  Details: {} at position {}".format(error.error.msg, error.error.pos)
+	]
+
+def _handle_resolution_error(error, debugging):
+	if not error.suggestion:
+		return []
+	return ["Did you mean '{}'?".format(error.suggestion)]
+
+_error_handlers = {
+	errors.AttributeResolutionError: _handle_resolution_error,
+	errors.FunctionCallError: _handle_function_call_error,
+	errors.RegexSyntaxError: _handle_regex_syntax_error,
+	errors.SymbolResolutionError: _handle_resolution_error
+}
+def _get_error_handler(error):
+	# check the exact class first, then fall back to the parent classes so subclasses are handled too
+	for error_class in error.__class__.__mro__:
+		handler = _error_handlers.get(error_class)
+		if handler is not None:
+			return handler
+	return None
 
 def main():
 	parser = argparse.ArgumentParser(description='Rule Engine: Debug REPL', conflict_handler='resolve')
@@ -74,23 +161,34 @@ def main():
 		type=argparse.FileType('r'),
 		help='edit the environment (via a file)'
 	)
+	parser.add_argument(
+		'--truncate',
+		action='store_true',
+		default=False,
+		help='truncate large results'
+	)
 	parser.add_argument('-v', '--version', action='version', version=parser.prog + ' Version: ' + __version__)
 	arguments = parser.parse_args()
+	# defer this import until after the arguments are parsed so --help and --version return quickly
+	import pprint
 
 	context = engine.Context()
 	thing = None
-	if arguments.edit_console or arguments.edit_file:
+	edit_file_state = None
+	if arguments.edit_file and not arguments.edit_console:
+		# when only a file is used, its results can be reused for as long as it has not changed
+		edit_file_state = _edit_file_states.get(_file_key(arguments.edit_file))
+	if edit_file_state:
+		context, thing = edit_file_state
+	elif arguments.edit_console or arguments.edit_file:
+		import code
 		console = code.InteractiveConsole({
 			'context': context,
 			'thing': thing
 		})
 		if arguments.edit_file:
 			print('executing: ' + arguments.edit_file.name)
-			console.runcode(code.compile_command(
-				arguments.edit_file.read(),
-				filename=arguments.edit_file.name,
-				symbol='exec'
-			))
+			console.runcode(_compile_file(arguments.edit_file))
 		if arguments.edit_console:
 			_console_interact(
 				console,
@@ -99,7 +197,16 @@ def main():
 			)
 		context = console.locals['context']
 		thing = console.locals['thing']
+		if not arguments.edit_console:
+			_edit_file_states[_file_key(arguments.edit_file)] = (context, thing)
 	debugging = arguments.debug
+	if arguments.truncate:
+		format_result = _TruncatedRepr().repr
+	else:
+		format_result = functools.partial(pprint.pformat, indent=4)
+	# load the history after the edit console so the histories are not mixed
+	history_file = os.path.join(os.path.expanduser('~'), '.rule_engine_repl_history')
+	use_history = sys.stdin.isatty() and _load_history(history_file)
 
 	while True:
 		try:
@@ -107,38 +214,38 @@ def main():
 		except (EOFError, KeyboardInterrupt):
 			break
 
-		match = re.match(r'\s*#!\s*debug\s*=\s*(\w+)', rule_text)
-		if match:
-			debugging = match.group(1).lower() != 'false'
-			print('# debugging = ' + str(debugging).lower())
-			continue
+		# only directives need to be checked against the regex
+		if rule_text.lstrip().startswith('#!'):
+			match = _debug_directive_regex.match(rule_text)
+			if match:
+				debugging = match.group(1).lower() != 'false'
+				print('# debugging = ' + str(debugging).lower())
+				continue
 
 		try:
+			# repeated lines, such as those from a pasted block, reuse the statement cached on the context
 			rule = engine.Rule(rule_text, context=context)
 			result = rule.evaluate(thing)
 		except errors.EngineError as error:
-			print("{}: {}".format(error.__class__.__name__, error.message))
-			if isinstance(error, (errors.AttributeResolutionError, errors.SymbolResolutionError)) and error.suggestion:
-				print("Did you mean '{}'?".format(error.suggestion))
-			elif isinstance(error, errors.RegexSyntaxError):
-				print("  Regex:   {!r}".format(error.error.pattern))
-				print("  Details: {} at position {}".format(error.error.msg, error.error.pos))
-			elif isinstance(error, errors.FunctionCallError):
-				print("  Function:  {!r}".format(error.function_name))
-				if debugging and error.error:
-					inner_exception = ''.join(traceback.format_exception(
-						error.error,
-						error.error,
-						error.error.__traceback__
-					))
-					print(textwrap.indent(inner_exception, ' ' * 4))
+			# build the entire report so it can be written out at once
+			parts = ["{}: {}".format(error.__class__.__name__, error.message)]
+			handler = _get_error_handler(error)
+			if handler is not None:
+				parts.extend(handler(error, debugging))
 			if debugging:
-				traceback.print_exc()
+				# the function call error handler formats the inner exception which is usually chained to this one, so
+				# don't format it a second time
+				inner_formatted = isinstance(error, errors.FunctionCallError) and error.error
+				parts.append(_format_exception(error, chain=not inner_formatted))
+			sys.stderr.write('\n'.join(part.rstrip('\n') for part in parts) + '\n')
 		except Exception as error:
-			traceback.print_exc()
+			sys.stderr.write(traceback.format_exc())
 		else:
 			print('result: ')
-			pprint.pprint(result, indent=4)
+			print(format_result(result))
+
+	if use_history:
+		_save_history(history_file)
 
 if __name__ == '__main__':
 	main()
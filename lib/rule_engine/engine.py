@@ -38,21 +38,37 @@ import datetime
 import decimal
 import functools
 import math
+import operator
 import re
 import threading
+import types
+import weakref
 
 from . import ast
 from . import builtins
 from . import errors
 from . import parser
+from .parser.utilities import parse_float
 from .suggestions import suggest_symbol
 from .types import DataType
 
 import dateutil.tz
 
-def _tls_getter(thread_local, key, _builtins):
-	# a function stub to be used with functools.partial for retrieving thread-local values
-	return getattr(thread_local.storage, key)
+_float_regex = re.compile(r'^(' + parser.Parser.get_token_regex('FLOAT') + ')$')
+# the tzinfo objects are immutable so a single instance of each can be shared by all contexts
+_timezones = {
+	'local': dateutil.tz.tzlocal(),
+	'utc': dateutil.tz.tzutc()
+}
+
+_missing = object()
+
+# suggestions are built by module-level functions so errors can still be pickled before they've been resolved
+def _suggest_attribute(name, thing):
+	return suggest_symbol(name, dir(thing))
+
+def _suggest_item(name, thing):
+	return suggest_symbol(name, thing.keys())
 
 def resolve_attribute(thing, name):
 	"""
@@ -68,9 +84,10 @@ def resolve_attribute(thing, name):
 	:param str name: The symbol name that is being resolved.
 	:return: The value for the corresponding attribute *name*.
 	"""
-	if not hasattr(thing, name):
-		raise errors.SymbolResolutionError(name, thing=thing, suggestion=suggest_symbol(name, dir(thing)))
-	return getattr(thing, name)
+	try:
+		return getattr(thing, name)
+	except AttributeError:
+		raise errors.SymbolResolutionError(name, thing=thing, suggestion=functools.partial(_suggest_attribute, name, thing)) from None
 
 def resolve_item(thing, name):
 	"""
@@ -84,14 +101,44 @@ def resolve_item(thing, name):
 	"""
 	if not isinstance(thing, collections.abc.Mapping):
 		raise errors.SymbolResolutionError(name, thing=thing)
-	if name not in thing:
-		raise errors.SymbolResolutionError(name, thing=thing, suggestion=suggest_symbol(name, thing.keys()))
-	return thing[name]
+	if type(thing) is dict:
+		# a plain dictionary can look the item up once, subclasses and other mappings may override __contains__ and
+		# __getitem__ so they're used as is
+		value = thing.get(name, _missing)
+		if value is not _missing:
+			return value
+	elif name in thing:
+		return thing[name]
+	raise errors.SymbolResolutionError(name, thing=thing, suggestion=functools.partial(_suggest_item, name, thing))
 
 def _type_resolver(type_map, name):
-	if name not in type_map:
-		raise errors.SymbolResolutionError(name, suggestion=suggest_symbol(name, type_map.keys()))
-	return type_map[name]
+	data_type = type_map.get(name)
+	if data_type is None:
+		raise errors.SymbolResolutionError(name, suggestion=functools.partial(_suggest_item, name, type_map))
+	return data_type
+
+_scalar_data_types = {}
+def _data_type_from_value(value):
+	# the data type of a scalar value is determined by its Python type alone so it can be cached, while compound types
+	# depend on their members
+	python_type = type(value)
+	data_type = _scalar_data_types.get(python_type)
+	if data_type is None:
+		data_type = ast.DataType.from_value(value)
+		if data_type.is_scalar:
+			_scalar_data_types[python_type] = data_type
+	return data_type
+
+_bytes_decoders = {
+	'base16': lambda value: binascii.b2a_hex(value).decode(),
+	'base64': lambda value: binascii.b2a_base64(value).decode().strip(),
+	'hex': lambda value: binascii.b2a_hex(value).decode()
+}
+_string_encoders = {
+	'base16': binascii.a2b_hex,
+	'base64': binascii.a2b_base64,
+	'hex': binascii.a2b_hex
+}
 
 def _float_op(value, op):
 	if value.is_nan() or value.is_infinite():
@@ -131,9 +178,13 @@ def _value_with_result_type(name, object_type):
 	return ast.DataType.FUNCTION(name, argument_types=(object_type,), return_type=ast.DataType.BOOLEAN)
 
 class _AttributeResolverFunction(object):
-	__slots__ = ('function', 'type_resolver')
+	__slots__ = ('function', 'is_method', 'result_type', 'type_resolver')
 	def __init__(self, function, *, result_type, type_resolver):
 		self.function = function
+		# functions are called with the resolver like methods while other callables (such as those from the operator
+		# module) only take the value, which saves a Python frame for the simple attributes
+		self.is_method = isinstance(function, types.FunctionType)
+		self.result_type = result_type or ast.DataType.UNDEFINED
 		if result_type and result_type is not ast.DataType.UNDEFINED:
 			if not DataType.is_definition(result_type):
 				raise TypeError('result_type must be a DataType definition')
@@ -151,6 +202,7 @@ class _AttributeResolverFunction(object):
 	def resolve_type(self, object_type):
 		return self.type_resolver(object_type)
 
+_result_types_cache_size = 1024
 class _AttributeResolver(object):
 	class attribute(object):
 		__slots__ = ('types', 'name', 'result_type', 'type_resolver')
@@ -166,22 +218,55 @@ class _AttributeResolver(object):
 				self.type_map[type_][self.name] = _AttributeResolverFunction(function, result_type=self.result_type, type_resolver=self.type_resolver)
 			return function
 
+	__slots__ = ('_resolver_index', '_result_types')
+	def __init__(self):
+		# index the resolvers by the python type of their data type so the compatibility checks can be skipped for the
+		# common cases, each python type maps to a single data type and the registered compound types are compatible with
+		# any member types
+		self._resolver_index = {}
+		for data_type, attribute_resolvers in self.attribute.type_map.items():
+			if not data_type.is_scalar and data_type != getattr(ast.DataType, data_type.name):
+				continue
+			self._resolver_index.setdefault(data_type.python_type, {}).update(attribute_resolvers)
+		# the result types are derived solely from the object type and name, so memoize them to avoid rebuilding the
+		# compound types each time the same attribute is checked while parsing
+		self._result_types = {}
+
 	def __call__(self, thing, object_, name):
 		try:
-			object_type = ast.DataType.from_value(object_)
+			object_type = _data_type_from_value(object_)
 		except TypeError:
 			# if the object can't be mapped to a supported type, raise a resolution error
 			raise errors.AttributeResolutionError(name, object_, thing=thing) from None
 		resolver = self._get_resolver(object_type, name, thing=thing)
-		value = resolver.function(self, object_)
+		if resolver.is_method:
+			value = resolver.function(self, object_)
+		else:
+			value = resolver.function(object_)
+		result_type = resolver.result_type
+		if result_type.is_scalar:
+			# skip the coercion and type checks when the value is already of the static result type
+			if type(value) is result_type.python_type:
+				return value
+			if result_type is ast.DataType.FLOAT:
+				# numeric attributes such as the datetime fields and total_seconds return native numbers
+				if type(value) is int:
+					return decimal.Decimal(value)
+				if type(value) is float:
+					return decimal.Decimal(repr(value))
 		value = ast.coerce_value(value)
-		value_type = ast.DataType.from_value(value)
+		value_type = _data_type_from_value(value)
 		expected_value_type = resolver.resolve_type(value_type)
 		if ast.DataType.is_compatible(expected_value_type, value_type):
 			return value
 		raise errors.AttributeTypeError(name, object_, is_value=value, is_type=value_type, expected_type=expected_value_type)
 
 	def _get_resolver(self, object_type, name, thing=errors.UNDEFINED):
+		attribute_resolvers = self._resolver_index.get(object_type.python_type)
+		if attribute_resolvers is not None:
+			resolver = attribute_resolvers.get(name)
+			if resolver is not None:
+				return resolver
 		for data_type, attribute_resolvers in self.attribute.type_map.items():
 			if ast.DataType.is_compatible(data_type, object_type):
 				break
@@ -189,7 +274,9 @@ class _AttributeResolver(object):
 			raise errors.AttributeResolutionError(name, object_type, thing=thing)
 		resolver = attribute_resolvers.get(name)
 		if resolver is None:
-			raise errors.AttributeResolutionError(name, object_type, thing=thing, suggestion=suggest_symbol(name, attribute_resolvers.keys()))
+			raise errors.AttributeResolutionError(name, object_type, thing=thing, suggestion=functools.partial(suggest_symbol, name, tuple(attribute_resolvers)))
+		if object_type.is_scalar:
+			self._resolver_index.setdefault(object_type.python_type, {})[name] = resolver
 		return resolver
 
 	def resolve_type(self, object_type, name):
@@ -200,72 +287,62 @@ class _AttributeResolver(object):
 		:param str name: The name of the attribute to retrieve the data type of.
 		:return: The data type of the specified attribute.
 		"""
-		return self._get_resolver(object_type, name).resolve_type(object_type)
+		key = (object_type, name)
+		result_type = self._result_types.get(key)
+		if result_type is None:
+			result_type = self._get_resolver(object_type, name).resolve_type(object_type)
+			if len(self._result_types) < _result_types_cache_size:
+				self._result_types[key] = result_type
+		return result_type
 
 	@attribute('decode', ast.DataType.BYTES, result_type=ast.DataType.FUNCTION('decode', return_type=ast.DataType.STRING, argument_types=(ast.DataType.STRING,)))
 	def bytes_decode(self, value):
-		return functools.partial(self._bytes_decode, value)
+		# return a closure instead of a partial, it's cheaper to both create and call
+		def decode(encoding):
+			return self._bytes_decode(value, encoding)
+		return decode
 
 	@classmethod
 	def _bytes_decode(self, value, encoding):
 		encoding = encoding.lower()
-		if encoding == 'base16' or encoding == 'hex':
-			return binascii.b2a_hex(value).decode()
-		elif encoding == 'base64':
-			return binascii.b2a_base64(value).decode().strip()
+		decoder = _bytes_decoders.get(encoding)
+		if decoder is not None:
+			return decoder(value)
 		try:
 			return value.decode(encoding)
 		except LookupError as error:
 			raise errors.FunctionCallError("invalid encoding name {}".format(encoding), error=error, function_name='decode')
 
-	@attribute('to_epoch', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
-	def datetime_to_epoch(self, value):
-		return value.timestamp()
+	datetime_to_epoch = attribute('to_epoch', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)(operator.methodcaller('timestamp'))
 
 	@attribute('date', ast.DataType.DATETIME, result_type=ast.DataType.DATETIME)
 	def datetime_date(self, value):
 		return value.replace(hour=0, minute=0, second=0, microsecond=0)
 
-	@attribute('day', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
-	def datetime_day(self, value):
-		return value.day
+	datetime_day = attribute('day', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)(operator.attrgetter('day'))
 
-	@attribute('hour', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
-	def datetime_hour(self, value):
-		return value.hour
+	datetime_hour = attribute('hour', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)(operator.attrgetter('hour'))
 
-	@attribute('microsecond', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
-	def datetime_microsecond(self, value):
-		return value.microsecond
+	datetime_microsecond = attribute('microsecond', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)(operator.attrgetter('microsecond'))
 
 	@attribute('millisecond', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
 	def datetime_millisecond(self, value):
 		return value.microsecond / 1000
 
-	@attribute('minute', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
-	def datetime_minute(self, value):
-		return value.minute
+	datetime_minute = attribute('minute', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)(operator.attrgetter('minute'))
 
-	@attribute('month', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
-	def datetime_month(self, value):
-		return value.month
+	datetime_month = attribute('month', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)(operator.attrgetter('month'))
 
-	@attribute('second', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
-	def datetime_second(self, value):
-		return value.second
+	datetime_second = attribute('second', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)(operator.attrgetter('second'))
 
 	@attribute('weekday', ast.DataType.DATETIME, result_type=ast.DataType.STRING)
 	def datetime_weekday(self, value):
 		# use strftime %A so the value is localized
 		return value.strftime('%A')
 
-	@attribute('year', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)
-	def datetime_year(self, value):
-		return value.year
+	datetime_year = attribute('year', ast.DataType.DATETIME, result_type=ast.DataType.FLOAT)(operator.attrgetter('year'))
 
-	@attribute('zone_name', ast.DataType.DATETIME, result_type=ast.DataType.STRING)
-	def datetime_zone_name(self, value):
-		return value.tzname()
+	datetime_zone_name = attribute('zone_name', ast.DataType.DATETIME, result_type=ast.DataType.STRING)(operator.methodcaller('tzname'))
 
 	@attribute('ceiling', ast.DataType.FLOAT, result_type=ast.DataType.FLOAT)
 	def float_ceiling(self, value):
@@ -275,9 +352,7 @@ class _AttributeResolver(object):
 	def float_floor(self, value):
 		return _float_op(value, math.floor)
 
-	@attribute('is_nan', ast.DataType.FLOAT, result_type=ast.DataType.BOOLEAN)
-	def float_is_nan(self, value):
-		return math.isnan(value)
+	float_is_nan = attribute('is_nan', ast.DataType.FLOAT, result_type=ast.DataType.BOOLEAN)(operator.methodcaller('is_nan'))
 
 	@attribute('to_flt', ast.DataType.FLOAT, result_type=ast.DataType.FLOAT)
 	def float_to_flt(self, value):
@@ -289,36 +364,31 @@ class _AttributeResolver(object):
 			raise errors.EvaluationError('data type mismatch (not an integer number)')
 		return value
 
-	@attribute('keys', ast.DataType.MAPPING, result_type=ast.DataType.ARRAY)
-	def mapping_keys(self, value):
-		return tuple(value.keys())
+	mapping_keys = attribute('keys', ast.DataType.MAPPING, result_type=ast.DataType.ARRAY)(tuple)
 
 	@attribute('values', ast.DataType.MAPPING, result_type=ast.DataType.ARRAY)
 	def mapping_values(self, value):
 		return tuple(value.values())
 
-	@attribute('as_lower', ast.DataType.STRING, result_type=ast.DataType.STRING)
-	def string_as_lower(self, value):
-		return value.lower()
+	string_as_lower = attribute('as_lower', ast.DataType.STRING, result_type=ast.DataType.STRING)(operator.methodcaller('lower'))
 
-	@attribute('as_upper', ast.DataType.STRING, result_type=ast.DataType.STRING)
-	def string_as_upper(self, value):
-		return value.upper()
+	string_as_upper = attribute('as_upper', ast.DataType.STRING, result_type=ast.DataType.STRING)(operator.methodcaller('upper'))
 
 	@attribute('encode', ast.DataType.STRING, result_type=ast.DataType.FUNCTION('encode', return_type=ast.DataType.BYTES, argument_types=(ast.DataType.STRING,)))
 	def string_encode(self, value):
-		return functools.partial(self._string_encode, value)
+		def encode(encoding):
+			return self._string_encode(value, encoding)
+		return encode
 
 	@classmethod
 	def _string_encode(self, value, encoding):
 		encoding = encoding.lower()
-		try:
-			if encoding == 'base16' or encoding == 'hex':
-				return binascii.a2b_hex(value.encode())
-			elif encoding == 'base64':
-				return binascii.a2b_base64(value.encode())
-		except binascii.Error as error:
-			raise errors.FunctionCallError("error converting to {}".format(encoding), error=error, function_name='encode')
+		encoder = _string_encoders.get(encoding)
+		if encoder is not None:
+			try:
+				return encoder(value.encode())
+			except binascii.Error as error:
+				raise errors.FunctionCallError("error converting to {}".format(encoding), error=error, function_name='encode')
 		try:
 			return value.encode(encoding)
 		except LookupError as error:
@@ -327,12 +397,15 @@ class _AttributeResolver(object):
 	@attribute('to_flt', ast.DataType.STRING, result_type=ast.DataType.FLOAT)
 	def string_to_flt(self, value):
 		value = value.strip()
-		if re.match(r'-?inf', value):
+		if value.startswith(('inf', '-inf')):
 			return decimal.Decimal(value)
-		match = re.match(r'^(' + parser.Parser.get_token_regex('FLOAT') + ')$', value)
-		if match is None:
+		if _float_regex.match(value) is None:
+			return decimal.Decimal('nan')
+		# parse the value the same as a FLOAT literal, which avoids compiling it and losing precision through a float
+		try:
+			return parse_float(value)
+		except errors.FloatSyntaxError:
 			return decimal.Decimal('nan')
-		return parser.literal_eval(match.group(0))
 
 	@attribute('to_int', ast.DataType.STRING, result_type=ast.DataType.FLOAT)
 	def string_to_int(self, value):
@@ -341,66 +414,52 @@ class _AttributeResolver(object):
 			raise errors.EvaluationError('data type mismatch (not an integer number)')
 		return value
 
-	@attribute('days', ast.DataType.TIMEDELTA, result_type=ast.DataType.FLOAT)
-	def timedelta_days(self, value):
-		return value.days
+	timedelta_days = attribute('days', ast.DataType.TIMEDELTA, result_type=ast.DataType.FLOAT)(operator.attrgetter('days'))
 
-	@attribute('seconds', ast.DataType.TIMEDELTA, result_type=ast.DataType.FLOAT)
-	def timedelta_seconds(self, value):
-		return value.seconds
+	timedelta_seconds = attribute('seconds', ast.DataType.TIMEDELTA, result_type=ast.DataType.FLOAT)(operator.attrgetter('seconds'))
 
-	@attribute('microseconds', ast.DataType.TIMEDELTA, result_type=ast.DataType.FLOAT)
-	def timedelta_microseconds(self, value):
-		return value.microseconds
+	timedelta_microseconds = attribute('microseconds', ast.DataType.TIMEDELTA, result_type=ast.DataType.FLOAT)(operator.attrgetter('microseconds'))
 
-	@attribute('total_seconds', ast.DataType.TIMEDELTA, result_type=ast.DataType.FLOAT)
-	def timedelta_total_seconds(self, value):
-		return value.total_seconds()
+	timedelta_total_seconds = attribute('total_seconds', ast.DataType.TIMEDELTA, result_type=ast.DataType.FLOAT)(operator.methodcaller('total_seconds'))
 
 	@attribute('ends_with', ast.DataType.ARRAY, ast.DataType.BYTES, ast.DataType.STRING, type_resolver=functools.partial(_value_with_result_type, 'ends_with'))
 	def value_ends_with(self, value):
-		return functools.partial(self._value_ends_with, value)
-
-	def _value_ends_with(self, value, suffix):
-		return value[-len(suffix):] == suffix
+		def ends_with(suffix):
+			return value[-len(suffix):] == suffix
+		return ends_with
 
 	@attribute('is_empty', ast.DataType.ARRAY, ast.DataType.BYTES, ast.DataType.STRING, ast.DataType.MAPPING, ast.DataType.SET, result_type=ast.DataType.BOOLEAN)
 	def value_is_empty(self, value):
 		return len(value) == 0
 
-	@attribute('length', ast.DataType.ARRAY, ast.DataType.BYTES, ast.DataType.STRING, ast.DataType.MAPPING, ast.DataType.SET, result_type=ast.DataType.FLOAT)
-	def value_length(self, value):
-		return len(value)
+	value_length = attribute('length', ast.DataType.ARRAY, ast.DataType.BYTES, ast.DataType.STRING, ast.DataType.MAPPING, ast.DataType.SET, result_type=ast.DataType.FLOAT)(len)
 
 	@attribute('starts_with', ast.DataType.ARRAY, ast.DataType.BYTES, ast.DataType.STRING, type_resolver=functools.partial(_value_with_result_type, 'starts_with'))
 	def value_starts_with(self, value):
-		return functools.partial(self._value_starts_with, value)
-
-	def _value_starts_with(self, value, prefix):
-		return value[:len(prefix)] == prefix
+		def starts_with(prefix):
+			return value[:len(prefix)] == prefix
+		return starts_with
 
-	@attribute('to_ary', ast.DataType.ARRAY, ast.DataType.BYTES, ast.DataType.SET, ast.DataType.STRING, type_resolver=_value_to_ary_result_type)
-	def value_to_ary(self, value):
-		return tuple(value)
+	value_to_ary = attribute('to_ary', ast.DataType.ARRAY, ast.DataType.BYTES, ast.DataType.SET, ast.DataType.STRING, type_resolver=_value_to_ary_result_type)(tuple)
 
 	@attribute('to_str', ast.DataType.FLOAT, ast.DataType.STRING, result_type=ast.DataType.STRING)
 	def value_to_str(self, value):
 		if isinstance(value, str):
 			return value
+		if value.is_finite():
+			return str(value)
 		# keep the string representations consistent for nan, inf, -inf
 		if value.is_nan():
 			return 'nan'
-		elif value.is_infinite():
-			if value.is_signed():
-				return '-inf'
-			else:
-				return 'inf'
-		return str(value)
+		elif value.is_signed():
+			return '-inf'
+		return 'inf'
 
 	@attribute('to_set', ast.DataType.ARRAY, ast.DataType.BYTES, ast.DataType.SET, ast.DataType.STRING, type_resolver=_value_to_set_result_type)
 	def value_to_set(self, value):
 		return set(value)
 
+_re_groups_type = ast.DataType.ARRAY(ast.DataType.STRING)
 class _ThreadLocalStorage(object):
 	"""
 	An object whose attributes are required to be tracked separately among multiple threads. This is to guarantee that
@@ -409,13 +468,23 @@ class _ThreadLocalStorage(object):
 	"""
 	__slots__ = ('assignment_scopes', 'regex_groups')
 	def __init__(self):
-		self.assignment_scopes = collections.deque()
+		self.assignment_scopes = []
 		self.regex_groups = None
 
 	def reset(self):
 		self.assignment_scopes.clear()
 		self.regex_groups = None
 
+class _ThreadLocal(threading.local):
+	# initialized once for each thread the first time it is accessed, so the storage is always present
+	def __init__(self):
+		super(_ThreadLocal, self).__init__()
+		self.storage = _ThreadLocalStorage()
+
+	def get_regex_groups(self, _builtins):
+		# used as the builtin value generator for $re_groups
+		return self.storage.regex_groups
+
 class Context(object):
 	"""
 	An object defining the context for a rule's evaluation. This can be used to change the behavior of certain aspects
@@ -446,7 +515,9 @@ class Context(object):
 		:param decimal_context: A specific :py:class:`decimal.Context` object to use for evaluation of ``FLOAT`` values.
 			The default value will be taken from the current thread and will be used by all evaluations using this
 			:py:class:`~rule_engine.engine.Context` regardless of the decimal context of the thread which evaluates the
-			rule. This causes the rule evaluation to be consistent regardless of the calling thread.
+			rule. This causes the rule evaluation to be consistent regardless of the calling thread. When a specific
+			context is specified and it is already the active context of the thread which evaluates the rule, it is used
+			directly so the signal flags raised by the evaluation are recorded on it.
 
 		.. versionchanged:: 2.0.0
 			Added the *default_value* parameter.
@@ -468,31 +539,33 @@ class Context(object):
 		"""
 		if isinstance(default_timezone, str):
 			default_timezone = default_timezone.lower()
-			if default_timezone == 'local':
-				default_timezone = dateutil.tz.tzlocal()
-			elif default_timezone == 'utc':
-				default_timezone = dateutil.tz.tzutc()
-			else:
+			if default_timezone not in _timezones:
 				raise ValueError('unsupported timezone: ' + default_timezone)
+			default_timezone = _timezones[default_timezone]
 		elif not isinstance(default_timezone, datetime.tzinfo):
 			raise TypeError('invalid default_timezone type')
-		self._thread_local = threading.local()
+		self._thread_local = _ThreadLocal()
+		self._statement_cache = {}
 		self.default_timezone = default_timezone
 		"""The *default_timezone* parameter from :py:meth:`~__init__`"""
 		self.default_value = default_value
 		"""The *default_value* parameter from :py:meth:`~__init__`"""
 		self.builtins = builtins.Builtins.from_defaults(
-			values={'re_groups': builtins.BuiltinValueGenerator(functools.partial(_tls_getter, self._thread_local, 'regex_groups'))},
-			value_types={'re_groups': ast.DataType.ARRAY(ast.DataType.STRING)},
+			values={'re_groups': builtins.BuiltinValueGenerator(self._thread_local.get_regex_groups)},
+			value_types={'re_groups': _re_groups_type},
 			timezone=default_timezone
 		)
 		"""An instance of :py:class:`~rule_engine.builtins.Builtins` to provided a default set of builtin symbol values."""
 		self.decimal_context = decimal_context or decimal.getcontext()
 		"""The *decimal_context* parameter from :py:meth:`~__init__`"""
+		self._decimal_context_explicit = decimal_context is not None
 		if isinstance(type_resolver, collections.abc.Mapping):
 			type_resolver = type_resolver_from_dict(type_resolver)
 		self.__type_resolver = type_resolver or (lambda _: ast.DataType.UNDEFINED)
 		self.__resolver = resolver or resolve_item
+		if self.__class__.resolve_attribute is Context.resolve_attribute:
+			# when it's not overridden, the method can be skipped by calling the attribute resolver directly
+			self.resolve_attribute = self.__resolve_attribute
 
 	@contextlib.contextmanager
 	def assignments(self, *assignments):
@@ -503,16 +576,15 @@ class Context(object):
 		:param assignments: The one or more assignments to define.
 		:type assignments: :py:class:`~rule_engine.ast.Assignment`
 		"""
-		self._tls.assignment_scopes.append({assign.name: assign for assign in assignments})
+		assignment_scopes = self._tls.assignment_scopes
+		assignment_scopes.append({assign.name: assign for assign in assignments})
 		try:
 			yield
 		finally:
-			self._tls.assignment_scopes.pop()
+			assignment_scopes.pop()
 
 	@property
 	def _tls(self):
-		if not hasattr(self._thread_local, 'storage'):
-			self._thread_local.storage = _ThreadLocalStorage()
 		return self._thread_local.storage
 
 	def resolve(self, thing, name, scope=None):
@@ -529,16 +601,22 @@ class Context(object):
 		:param str name: The symbol name that is being resolved.
 		:return: The value for the corresponding symbol *name*.
 		"""
-		if scope == builtins.Builtins.scope_name:
-			thing = self.builtins
-		if isinstance(thing, builtins.Builtins):
-			return resolve_item(thing, name)
 		if scope is None:
-			for assignments in self._tls.assignment_scopes:
-				if name in assignments:
-					return assignments[name].value
+			# most symbols have no scope, so check for it first to skip comparing the scope name
+			if isinstance(thing, builtins.Builtins):
+				return resolve_item(thing, name)
+			# assignments are only present while evaluating expressions such as comprehensions
+			assignment_scopes = self._tls.assignment_scopes
+			if assignment_scopes:
+				for assignments in assignment_scopes:
+					if name in assignments:
+						return assignments[name].value
 			return self.__resolver(thing, name)
-		raise errors.SymbolResolutionError(name, symbol_scope=scope, thing=thing)
+		if scope == builtins.Builtins.scope_name:
+			thing = self.builtins
+		elif not isinstance(thing, builtins.Builtins):
+			raise errors.SymbolResolutionError(name, symbol_scope=scope, thing=thing)
+		return resolve_item(thing, name)
 
 	__resolve_attribute = _AttributeResolver()
 	def resolve_attribute(self, thing, object_, name):
@@ -570,11 +648,46 @@ class Context(object):
 		"""
 		if scope == builtins.Builtins.scope_name:
 			return self.builtins.resolve_type(name)
-		for assignments in self._tls.assignment_scopes:
-			if name in assignments:
-				return assignments[name].value_type
+		assignment_scopes = self._tls.assignment_scopes
+		if assignment_scopes:
+			for assignments in assignment_scopes:
+				if name in assignments:
+					return assignments[name].value_type
 		return self.__type_resolver(name)
 
+@functools.lru_cache(maxsize=512)
+def _is_valid_text(parser, text):
+	try:
+		parser.parse(text, Context())
+	except errors.EngineError:
+		return False
+	return True
+
+# statements are cached on the context that they were parsed with because each of their nodes refers to it, this way
+# they're collected together, each context holds up to _statement_cache_size of them
+_statement_cache_contexts = weakref.WeakSet()
+_statement_cache_lock = threading.Lock()
+_statement_cache_size = 512
+def _parse_statement(parser, text, context):
+	statements = getattr(context, '_statement_cache', None)
+	if statements is None:
+		# the context doesn't provide a cache
+		return parser.parse(text, context)
+	key = (parser, text)
+	# these attributes are public and are used while parsing, so the statement is only reused while they're unchanged
+	options = (context.regex_flags, context.default_timezone, context.builtins, context.default_value)
+	cached = statements.get(key)
+	if cached is not None and cached[0] == options[0] and cached[1] is options[1] and cached[2] is options[2] and cached[3] is options[3]:
+		return cached[4]
+	statement = parser.parse(text, context)
+	with _statement_cache_lock:
+		if key not in statements and len(statements) >= _statement_cache_size:
+			# evict the oldest entry
+			del statements[next(iter(statements))]
+		statements[key] = options + (statement,)
+		_statement_cache_contexts.add(context)
+	return statement
+
 class Rule(object):
 	"""
 	A rule which parses a string with a logical expression and can then evaluate an arbitrary object for whether or not
@@ -585,18 +698,32 @@ class Rule(object):
 	The :py:class:`~rule_engine.parser.Parser` instance that will be used for parsing the rule text into a compatible
 	abstract syntax tree (AST) for evaluation.
 	"""
-	def __init__(self, text, context=None):
+	__slots__ = ('text', 'context', 'statement', '__weakref__')
+	def __init__(self, text, context=None, cache=True):
 		"""
 		:param str text: The text of the logical expression.
 		:param context: The context to use for evaluating the expression on arbitrary objects. This can be used to
 			change the default behavior. The default context is :py:class:`.Context` but any object providing the same
 			interface (such as a subclass) can be used.
 		:type context: :py:class:`.Context`
+		:param bool cache: Whether or not to reuse the statement of a previous rule with the same *text* and *context*.
+			Statements are only reused while the context's *regex_flags*, *default_timezone*, *builtins* and
+			*default_value* attributes are unchanged.
+
+		.. versionchanged:: 4.6.0
+			Added the *cache* parameter.
 		"""
-		context = context or Context()
+		if context is None:
+			context = Context()
+			statement = self.parser.parse(text, context)
+		elif cache and self.parser is self.__class__.parser:
+			# reuse the statement when the same text has already been parsed with this context
+			statement = _parse_statement(self.parser, text, context)
+		else:
+			statement = self.parser.parse(text, context)
 		self.text = text
 		self.context = context
-		self.statement = self.parser.parse(text, context)
+		self.statement = statement
 
 	def __repr__(self):
 		return "<{0} text={1!r} >".format(self.__class__.__name__, self.text)
@@ -611,7 +738,21 @@ class Rule(object):
 
 		:param things: The collection of objects to iterate over.
 		"""
-		yield from (thing for thing in things if self.matches(thing))
+		# delegate to the builtin filter so the items that don't match are skipped in C, while still being a generator
+		yield from filter(self.matches, things)
+
+	@staticmethod
+	def clear_cache():
+		"""
+		Clear the statements and validity results that have been cached from parsing rule text.
+
+		.. versionadded:: 4.6.0
+		"""
+		with _statement_cache_lock:
+			for context in _statement_cache_contexts:
+				context._statement_cache.clear()
+			_statement_cache_contexts.clear()
+		_is_valid_text.cache_clear()
 
 	@classmethod
 	def is_valid(cls, text, context=None):
@@ -626,8 +767,11 @@ class Rule(object):
 		:return: Whether or not the expression is well formed and appears valid.
 		:rtype: bool
 		"""
+		if context is None:
+			# without a context, the result depends only on the text so it can be reused
+			return _is_valid_text(cls.parser, text)
 		try:
-			cls.parser.parse(text, (context or Context()))
+			cls.parser.parse(text, context)
 		except errors.EngineError:
 			return False
 		return True
@@ -642,7 +786,12 @@ class Rule(object):
 			boolean.
 		"""
 		self.context._tls.reset()
-		with decimal.localcontext(self.context.decimal_context):
+		decimal_context = self.context.decimal_context
+		if decimal.getcontext() is decimal_context and getattr(self.context, '_decimal_context_explicit', False):
+			# the specified decimal context is already active, so skip copying it into a new local context, the default
+			# context is still copied so the signal flags aren't raised on the caller's context
+			return self.statement.evaluate(thing)
+		with decimal.localcontext(decimal_context):
 			return self.statement.evaluate(thing)
 
 	def matches(self, thing):
@@ -670,6 +819,13 @@ class Rule(object):
 
 class DebugRule(Rule):
 	parser = None
-	def __init__(self, *args, **kwargs):
-		self.parser = parser.Parser(debug=True)
-		super(DebugRule, self).__init__(*args, **kwargs)
+	def __init__(self, text, context=None):
+		# the debug parser is built on first use because doing so writes out the parser tables, it's then shared
+		if DebugRule.parser is None:
+			DebugRule.parser = parser.Parser(debug=True)
+		if context is None:
+			context = Context()
+		self.text = text
+		self.context = context
+		# statements aren't cached so every rule is parsed and a trace of each parse operation is written
+		self.statement = self.parser.parse(text, context, debug=True)
@@ -50,8 +50,23 @@ class EngineError(Exception):
 		"""
 		:param str message: A text description of what error occurred.
 		"""
-		self.message = message
+		self._message = message
+
+	@property
+	def message(self):
 		"""A text description of what error occurred."""
+		# subclasses pass None to have the message formatted on demand because most errors are handled without it ever
+		# being used
+		if self._message is None:
+			self._message = self._format_message()
+		return self._message
+
+	@message.setter
+	def message(self, value):
+		self._message = value
+
+	def _format_message(self):
+		return None
 
 	def __repr__(self):
 		return "<{} message={!r} >".format(self.__class__.__name__, self.message)
@@ -160,15 +175,18 @@ class RuleSyntaxError(SyntaxError):
 		:param str message: A text description of what error occurred.
 		:param token: The PLY token (if available) which is related to the syntax error.
 		"""
-		if token is None:
-			position = 'EOF'
-		else:
-			position = "line {0}:{1}".format(token.lineno, token.lexpos)
-		message = message + ' at: ' + position
-		super(RuleSyntaxError, self).__init__(message)
+		super(RuleSyntaxError, self).__init__(None)
+		self._description = message
 		self.token = token
 		"""The PLY token (if available) which is related to the syntax error."""
 
+	def _format_message(self):
+		if self.token is None:
+			position = 'EOF'
+		else:
+			position = "line {0}:{1}".format(self.token.lineno, self.token.lexpos)
+		return self._description + ' at: ' + position
+
 class AttributeResolutionError(EvaluationError):
 	"""
 	An error raised with an attribute can not be resolved to a value.
@@ -180,7 +198,8 @@ class AttributeResolutionError(EvaluationError):
 		:param str attribute_name: The name of the symbol that can not be resolved.
 		:param object_: The value that *attribute_name* was used as an attribute for.
 		:param thing: The root-object that was used to resolve *object*.
-		:param str suggestion: An optional suggestion for a valid attribute name.
+		:param suggestion: An optional suggestion for a valid attribute name. This may also be a callable which returns the
+			suggestion, in which case it is only called the first time that :py:attr:`.suggestion` is accessed.
 
 		.. versionchanged:: 3.2.0
 			Added the *suggestion* parameter.
@@ -191,9 +210,23 @@ class AttributeResolutionError(EvaluationError):
 		"""The value that *attribute_name* was used as an attribute for."""
 		self.thing = thing
 		"""The root-object that was used to resolve *object*."""
-		self.suggestion = suggestion
+		self._suggestion = suggestion
+		super(AttributeResolutionError, self).__init__(None)
+
+	def _format_message(self):
+		return "unknown attribute: {0!r}".format(self.attribute_name)
+
+	@property
+	def suggestion(self):
 		"""An optional suggestion for a valid attribute name."""
-		super(AttributeResolutionError, self).__init__("unknown attribute: {0!r}".format(attribute_name))
+		# the message and suggestion are resolved on demand because most errors are handled without them ever being used
+		if callable(self._suggestion):
+			self._suggestion = self._suggestion()
+		return self._suggestion
+
+	@suggestion.setter
+	def suggestion(self, value):
+		self._suggestion = value
 
 	def __repr__(self):
 		return "<{} message={!r} suggestion={!r} >".format(self.__class__.__name__, self.message, self.suggestion)
@@ -221,12 +254,14 @@ class AttributeTypeError(EvaluationError):
 		"""The :py:class:`rule-engine type<rule_engine.ast.DataType>` of the incompatible attribute."""
 		self.expected_type = expected_type
 		"""The :py:class:`rule-engine type<rule_engine.ast.DataType>` that was expected for this attribute."""
-		message = "attribute {0!r} resolved to incorrect datatype (is: {1}, expected: {2})".format(
-			attribute_name,
-			is_type.name,
-			expected_type.name
+		super(AttributeTypeError, self).__init__(None)
+
+	def _format_message(self):
+		return "attribute {0!r} resolved to incorrect datatype (is: {1}, expected: {2})".format(
+			self.attribute_name,
+			self.is_type.name,
+			self.expected_type.name
 		)
-		super(AttributeTypeError, self).__init__(message)
 
 class LookupError(EvaluationError):
 	"""
@@ -253,7 +288,8 @@ class SymbolResolutionError(EvaluationError):
 		:param str symbol_name: The name of the symbol that can not be resolved.
 		:param str symbol_scope: The scope of where the symbol should be valid for resolution.
 		:param thing: The root-object that was used to resolve the symbol.
-		:param str suggestion: An optional suggestion for a valid symbol name.
+		:param suggestion: An optional suggestion for a valid symbol name. This may also be a callable which returns the
+			suggestion, in which case it is only called the first time that :py:attr:`.suggestion` is accessed.
 
 		.. versionchanged:: 2.0.0
 			Added the *thing* parameter.
@@ -266,9 +302,22 @@ class SymbolResolutionError(EvaluationError):
 		"""The scope of where the symbol should be valid for resolution."""
 		self.thing = thing
 		"""The root-object that was used to resolve the symbol."""
-		self.suggestion = suggestion
+		self._suggestion = suggestion
+		super(SymbolResolutionError, self).__init__(None)
+
+	def _format_message(self):
+		return "unknown symbol: {0!r}".format(self.symbol_name)
+
+	@property
+	def suggestion(self):
 		"""An optional suggestion for a valid symbol name."""
-		super(SymbolResolutionError, self).__init__("unknown symbol: {0!r}".format(symbol_name))
+		if callable(self._suggestion):
+			self._suggestion = self._suggestion()
+		return self._suggestion
+
+	@suggestion.setter
+	def suggestion(self, value):
+		self._suggestion = value
 
 	def __repr__(self):
 		return "<{} message={!r} suggestion={!r} >".format(self.__class__.__name__, self.message, self.suggestion)
@@ -291,12 +340,14 @@ class SymbolTypeError(EvaluationError):
 		"""The :py:class:`rule-engine type<rule_engine.ast.DataType>` of the incompatible symbol."""
 		self.expected_type = expected_type
 		"""The :py:class:`rule-engine type<rule_engine.ast.DataType>` that was expected for this symbol."""
-		message = "symbol {0!r} resolved to incorrect datatype (is: {1}, expected: {2})".format(
-			symbol_name,
-			is_type.name,
-			expected_type.name
+		super(SymbolTypeError, self).__init__(None)
+
+	def _format_message(self):
+		return "symbol {0!r} resolved to incorrect datatype (is: {1}, expected: {2})".format(
+			self.symbol_name,
+			self.is_type.name,
+			self.expected_type.name
 		)
-		super(SymbolTypeError, self).__init__(message)
 
 class FunctionCallError(EvaluationError):
 	"""
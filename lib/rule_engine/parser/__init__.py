@@ -32,6 +32,8 @@
 
 import ast as pyast
 import collections
+import functools
+import sys
 import types as pytypes
 
 from .. import ast
@@ -39,7 +41,13 @@ from .. import errors
 from .base import ParserBase
 from .utilities import timedelta_regex
 
-literal_eval = pyast.literal_eval
+# string and bytes literals evaluate to immutable values, so repeated ones can share the result
+literal_eval = functools.lru_cache(maxsize=512)(pyast.literal_eval)
+
+_future_reserved_words = frozenset(('elif', 'else', 'while'))
+
+def _set_token_lineno(token):
+	token.lineno = token.lexer.lexdata.count('\n', 0, token.lexpos) + 1
 
 class _DeferredAstNode(object):
 	__slots__ = ('cls', 'args', 'kwargs', 'method')
@@ -111,6 +119,8 @@ class Parser(ParserBase):
 	) + tuple(set(list(reserved_words.values()) + list(op_names.values())))
 
 	t_ignore = ' \t'
+	# line numbers are only needed for errors, so they're calculated from the token position when one is raised
+	t_ignore_newline = r'\n+'
 	# Tokens
 	t_BWAND            = r'\&'
 	t_BWOR             = r'\|'
@@ -129,6 +139,21 @@ class Parser(ParserBase):
 	t_RBRACKET         = r'\]'
 	t_LBRACE           = r'\{'
 	t_RBRACE           = r'\}'
+	# operators sharing a prefix are plain strings too, ply sorts these by decreasing regex length so the longest wins
+	t_POW              = r'\*\*'
+	t_MUL              = r'\*'
+	t_FDIV             = r'\/\/'
+	t_TDIV             = r'\/'
+	t_BWLSH            = r'<<'
+	t_LE               = r'<='
+	t_LT               = r'<'
+	t_BWRSH            = r'>>'
+	t_GE               = r'>='
+	t_GT               = r'>'
+	t_EQ_FZS           = r'=~~'
+	t_EQ_FZM           = r'=~'
+	t_NE_FZS           = r'!~~'
+	t_NE_FZM           = r'!~'
 	t_FLOAT            = r'0(b[01]+|o[0-7]+|x[0-9a-fA-F]+)|[0-9]+(\.[0-9]*)?([eE][+-]?[0-9]+)?|\.[0-9]+([eE][+-]?[0-9]+)?'
 	# attributes must be valid symbol names so the right side is more specific
 	t_ATTR             = r'(?<=\S)\.(?=[a-zA-Z_][a-zA-Z0-9_]*)'
@@ -175,81 +200,49 @@ class Parser(ParserBase):
 			return obj.__doc__
 		raise ValueError('unknown token: ' + token_name)
 
-	def t_POW(self, t):
-		r'\*\*?'
-		if t.value == '*':
-			t.type = 'MUL'
-		return t
-
-	def t_FDIV(self, t):
-		r'\/\/?'
-		if t.value == '/':
-			t.type = 'TDIV'
-		return t
-
-	def t_LT(self, t):
-		r'<([=<])?'
-		t.type = {'<': 'LT', '<=': 'LE', '<<': 'BWLSH'}[t.value]
-		return t
-
-	def t_GT(self, t):
-		r'>([=>])?'
-		t.type = {'>': 'GT', '>=': 'GE', '>>': 'BWRSH'}[t.value]
-		return t
-
-	def t_EQ_FZS(self, t):
-		r'=~~?'
-		if t.value == '=~':
-			t.type = 'EQ_FZM'
-		return t
-
-	def t_NE_FZS(self, t):
-		r'!~~?'
-		if t.value == '!~':
-			t.type = 'NE_FZM'
-		return t
-
 	def t_BYTES(self, t):
-		r'b(?P<quote>["\'])([^\\\n]|(\\.))*?(?P=quote)'
+		r'b(?:"[^"\\\n]*(?:\\.[^"\\\n]*)*"|\'[^\'\\\n]*(?:\\.[^\'\\\n]*)*\')'
 		t.value = t.value[1:]
 		return t
 
 	def t_DATETIME(self, t):
-		r'd(?P<quote>["\'])([^\\\n]|(\\.))*?(?P=quote)'
+		r'd(?:"[^"\\\n]*(?:\\.[^"\\\n]*)*"|\'[^\'\\\n]*(?:\\.[^\'\\\n]*)*\')'
 		t.value = t.value[2:-1]
 		return t
 
 	def t_TIMEDELTA(self, t):
-		r't(?P<quote>["\'])([^\\\n]|(\\.))*?(?P=quote)'
+		r't(?:"[^"\\\n]*(?:\\.[^"\\\n]*)*"|\'[^\'\\\n]*(?:\\.[^\'\\\n]*)*\')'
 		t.value = t.value[2:-1]
 		return t
 
 	def t_STRING(self, t):
-		r's?(?P<quote>["\'])([^\\\n]|(\\.))*?(?P=quote)'
+		r's?(?:"[^"\\\n]*(?:\\.[^"\\\n]*)*"|\'[^\'\\\n]*(?:\\.[^\'\\\n]*)*\')'
 		if t.value[0] == 's':
 			t.value = t.value[1:]
 		return t
 
 	def t_SYMBOL(self, t):
 		r'\$?[a-zA-Z_][a-zA-Z0-9_]*'
-		if t.value in ('elif', 'else', 'while'):
-			raise errors.RuleSyntaxError("syntax error (the {} keyword is reserved for future use)".format(t.value))
 		t.type = self.reserved_words.get(t.value, 'SYMBOL')
+		if t.type == 'SYMBOL':
+			if t.value in _future_reserved_words:
+				raise errors.RuleSyntaxError("syntax error (the {} keyword is reserved for future use)".format(t.value))
+			# symbol names are used as keys for every lookup while evaluating, so intern them to compare by identity
+			t.value = sys.intern(t.value)
 		return t
 
 	def t_COMMENT(self, t):
 		r'\#.*$'
 		return t
 
-	def t_newline(self, t):
-		r'\n+'
-		t.lexer.lineno += t.value.count("\n")
-
 	def t_error(self, t):
+		_set_token_lineno(t)
 		raise errors.RuleSyntaxError("syntax error (illegal character {0!r})".format(t.value[0]), t)
 
 	# Parsing Rules
 	def p_error(self, token):
+		if token is not None:
+			_set_token_lineno(token)
 		raise errors.RuleSyntaxError('syntax error', token)
 
 	def p_statement_expr(self, p):
@@ -397,7 +390,7 @@ class Parser(ParserBase):
 		scope = None
 		if name[0] == '$':
 			scope = 'built-in'
-			name = name[1:]
+			name = sys.intern(name[1:])
 		p[0] = _DeferredAstNode(ast.SymbolExpression, args=(self.context, name), kwargs={'scope': scope})
 
 	def p_expression_uminus(self, p):
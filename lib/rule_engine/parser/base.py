@@ -30,6 +30,7 @@
 #  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
 
+import copy
 import threading
 
 import ply.lex as lex
@@ -49,17 +50,68 @@ class ParserBase(object):
 	names.
 	"""
 	__mutex = threading.Lock()
+	__lexers = {}
 	def __init__(self, debug=False):
 		"""
 		:param bool debug: Whether or not to enable debugging features when
 			using the ply API.
 		"""
 		self.debug = debug
-		self.context = None
+		self.__thread_local = threading.local()
 		# Build the lexer and parser
-		self._lexer = lex.lex(module=self, debug=self.debug)
+		self._lexer = self.__build_lexer()
 		self._parser = yacc.yacc(module=self, debug=self.debug, write_tables=self.debug)
 
+	def __build_lexer(self):
+		# the token rules are class members, so the master regex is built once per class into a template lexer and
+		# each instance gets a copy of it with the function rules bound to itself
+		key = (self.__class__, self.debug)
+		with self.__mutex:
+			template = self.__lexers.get(key)
+			if template is None:
+				template = self.__lexers[key] = self.__unbind_lexer(lex.lex(module=self, debug=self.debug))
+		# Lexer.clone(object) can't be used for the rebinding because it only keeps the last regex of each state
+		lexer = template.clone()
+		lexer.lexstatere = {
+			state: [(regex, [self.__bind_rule(rule) for rule in rules]) for regex, rules in master_re]
+			for state, master_re in template.lexstatere.items()
+		}
+		lexer.lexstateerrorf = {state: getattr(self, function.__name__) for state, function in template.lexstateerrorf.items()}
+		lexer.lexstateeoff = {state: getattr(self, function.__name__) for state, function in template.lexstateeoff.items()}
+		lexer.lexmodule = self
+		lexer.begin('INITIAL')
+		return lexer
+
+	@staticmethod
+	def __unbind_lexer(lexer):
+		# ply requires an instance to build the lexer from, the template must not keep it alive through its bound methods
+		# though since the template is shared for the lifetime of the process
+		unbind = lambda function: getattr(function, '__func__', function)
+		lexer.lexstatere = {
+			state: [(regex, [rule if not rule or rule[0] is None else (unbind(rule[0]), rule[1]) for rule in rules]) for regex, rules in master_re]
+			for state, master_re in lexer.lexstatere.items()
+		}
+		lexer.lexstateerrorf = {state: unbind(function) for state, function in lexer.lexstateerrorf.items()}
+		lexer.lexstateeoff = {state: unbind(function) for state, function in lexer.lexstateeoff.items()}
+		lexer.lexmodule = None
+		lexer.begin('INITIAL')
+		return lexer
+
+	def __bind_rule(self, rule):
+		if not rule or rule[0] is None:
+			return rule
+		function, token_type = rule
+		return (getattr(self, function.__name__), token_type)
+
+	@property
+	def context(self):
+		"""The context of the parse operation that is running in the current thread."""
+		return getattr(self.__thread_local, 'context', None)
+
+	@context.setter
+	def context(self, value):
+		self.__thread_local.context = value
+
 	def parse(self, text, context, **kwargs):
 		"""
 		Parse the specified text in an abstract syntax tree of nodes that can later be evaluated. This is done in two
@@ -72,11 +124,20 @@ class ParserBase(object):
 		:return: The parsed AST statement.
 		:rtype: :py:class:`~rule_engine.ast.Statement`
 		"""
-		kwargs['lexer'] = kwargs.pop('lexer', self._lexer)
-		with self.__mutex:
-			self.context = context
+		thread_local = self.__thread_local
+		if not hasattr(thread_local, 'parser'):
+			# the lexer and parser track their progress on themselves, so each thread gets its own copies to allow parsing
+			# concurrently, the tables they're copied with are only ever read
+			thread_local.lexer = self._lexer.clone()
+			thread_local.parser = copy.copy(self._parser)
+		kwargs['lexer'] = kwargs.pop('lexer', thread_local.lexer)
+		thread_local.context = context
+		try:
 			# phase 1: parse the string into a tree of deferred nodes
-			result = self._parser.parse(text, **kwargs)
-			self.context = None
+			result = thread_local.parser.parse(text, **kwargs)
+		finally:
+			thread_local.context = None
+			# the parser keeps its symbol stack once it's done, drop it so the nodes (and their context) aren't kept alive
+			thread_local.parser.symstack = None
 		# phase 2: initialize each AST node recursively, providing them with an opportunity to define assignments
 		return result.build()
@@ -30,7 +30,6 @@
 #  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
 
-import ast as pyast
 import binascii
 import datetime
 import decimal
@@ -52,6 +51,8 @@ timedelta_regex = (
 	r')?'
 )
 
+_leading_zero_regex = re.compile(r'0[0-9]')
+
 def parse_datetime(string, default_timezone):
 	"""
 	Parse a timestamp string. If the timestamp does not specify a timezone, *default_timezone* is used.
@@ -75,11 +76,11 @@ def parse_float(string):
 	:param str string: The string to parse.
 	:rtype: decimal.Decimal
 	"""
-	if re.match('^0[0-9]', string):
+	if _leading_zero_regex.match(string):
 		raise errors.FloatSyntaxError('invalid floating point literal (leading zeros in decimal literals are not permitted)', string)
 	try:
-		if re.match('^0[box]', string):
-			val = decimal.Decimal(pyast.literal_eval(string))
+		if string.startswith(('0b', '0o', '0x')):
+			val = decimal.Decimal(int(string, 0))
 		else:
 			val = decimal.Decimal(string)
 	except Exception:
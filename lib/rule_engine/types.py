@@ -573,9 +573,10 @@ class DataType(metaclass=DataTypeMeta):
 		:return: Whether or not the two types are compatible.
 		:rtype: bool
 		"""
-		if not (cls.is_definition(dt1) and cls.is_definition(dt2)):
+		if not (isinstance(dt1, _DataTypeDef) and isinstance(dt2, _DataTypeDef)):
 			raise TypeError('argument is not a data type definition')
-		if dt1 is _DATA_TYPE_UNDEFINED or dt2 is _DATA_TYPE_UNDEFINED:
+		# compatibility is reflexive, so the same definition (such as the scalar singletons) is always compatible
+		if dt1 is dt2 or dt1 is _DATA_TYPE_UNDEFINED or dt2 is _DATA_TYPE_UNDEFINED:
 			return True
 		if dt1.is_scalar and dt2.is_scalar:
 			if isinstance(dt1, DataType.FUNCTION.__class__) and isinstance(dt2, DataType.FUNCTION.__class__):
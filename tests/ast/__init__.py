@@ -261,6 +261,33 @@ class AstTests(unittest.TestCase):
 		self.assertIsInstance(statement.expression, ast.FloatExpression)
 		self.assertEqual(statement.evaluate(None), 4)
 
+	def test_ast_reduces_logic(self):
+		parser_ = parser.Parser()
+		for rule_text, value in (('true and false', False), ('false and one', False), ('true or one', True)):
+			statement = parser_.parse(rule_text, self.context)
+			self.assertIsInstance(statement.expression, ast.BooleanExpression, msg=rule_text)
+			self.assertIs(statement.evaluate(None), value)
+
+		for rule_text in ('true and one == 1', 'false or one == 1', 'one == 1 and true', 'one == 1 or false'):
+			statement = parser_.parse(rule_text, self.context)
+			self.assertIsInstance(statement.expression, ast.ComparisonExpression, msg=rule_text)
+			self.assertTrue(statement.evaluate({'one': 1}))
+
+		# the side which is not a literal is not a boolean, so its value needs to be converted
+		statement = parser_.parse('true and one', self.context)
+		self.assertIsInstance(statement.expression, ast.LogicExpression)
+		self.assertIs(statement.evaluate({'one': 1}), True)
+		# the side which is not a literal needs to be evaluated first
+		statement = parser_.parse('one == 1 and false', self.context)
+		self.assertIsInstance(statement.expression, ast.LogicExpression)
+
+		# a symbol with a boolean type hint may still be null, which must still evaluate to a boolean
+		context = engine.Context(type_resolver={'flag': ast.DataType.BOOLEAN})
+		for rule_text, value in (('flag and true', False), ('true and flag', False), ('flag or false', False), ('false or flag', False), ('true and false or flag', False)):
+			statement = parser_.parse(rule_text, context)
+			self.assertIs(statement.evaluate({'flag': None}), value, msg=rule_text)
+			self.assertIs(statement.evaluate({'flag': True}), True, msg=rule_text)
+
 	def test_ast_reduces_ternary(self):
 		parser_ = parser.Parser()
 		statement = parser_.parse('true ? 1 : 0', self.context)
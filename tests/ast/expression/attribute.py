@@ -249,6 +249,11 @@ class GetAttributeExpressionTests(unittest.TestCase):
 			flt = decimal.Decimal(value)
 			self.assertEqual(expression.evaluate({'flt': flt}), value, "attribute {} failed".format(attribute_name))
 
+		expression = ast.GetAttributeExpression(context, symbol, 'is_nan')
+		for value in ('nan', 'snan'):
+			self.assertTrue(expression.evaluate({'flt': decimal.Decimal(value)}), 'attribute is_nan failed')
+		self.assertFalse(expression.evaluate({'flt': decimal.Decimal('inf')}), 'attribute is_nan failed')
+
 	def test_ast_expression_mapping_attributes(self):
 		mapping = dict(one=1, two=2, three=3)
 		symbol = ast.SymbolExpression(context, 'map')
@@ -267,6 +272,13 @@ class GetAttributeExpressionTests(unittest.TestCase):
 		expression = ast.GetAttributeExpression(context, symbol, 'length')
 		self.assertEqual(expression.evaluate({'map': {'length': -1}}), 1)
 
+		# verify that repeatedly accessing mapping keys as attributes still raises an error once the key is missing
+		expression = ast.GetAttributeExpression(context, symbol, 'key')
+		self.assertEqual(expression.evaluate({'map': {'key': 1}}), 1)
+		self.assertEqual(expression.evaluate({'map': {'key': 2}}), 2)
+		with self.assertRaises(errors.AttributeResolutionError):
+			expression.evaluate({'map': {}})
+
 	def test_ast_expression_set_attributes(self):
 		set_ = {1, 2, 3}
 		symbol = ast.SymbolExpression(context, 'set')
@@ -353,12 +365,23 @@ class GetAttributeExpressionTests(unittest.TestCase):
 		combos = (
 			('3.14159', decimal.Decimal('3.14159')),
 			('0xdead', 0xdead),
-			('3.14e5', decimal.Decimal('3.14e5'))
+			('3.14e5', decimal.Decimal('3.14e5')),
+			('3.141592653589793238462', decimal.Decimal('3.141592653589793238462'))
 		)
 		for str_value, flt_value in combos:
 			symbol = ast.StringExpression(context, str_value)
 			expression = ast.GetAttributeExpression(context, symbol, 'to_flt')
 			self.assertEqual(expression.evaluate(None), flt_value, "attribute {} failed".format(str_value))
+		# the value is formatted the same as the equivalent float literal
+		for str_value in ('1e5', '1.50', '3.14e5'):
+			symbol = ast.StringExpression(context, str_value)
+			expression = ast.GetAttributeExpression(context, symbol, 'to_flt')
+			self.assertEqual(str(expression.evaluate(None)), str(engine.Rule(str_value).evaluate(None)))
+		# values that aren't valid float literals, such as those with leading zeros, are not numbers
+		for str_value in ('007', '00.5', 'abc'):
+			symbol = ast.StringExpression(context, str_value)
+			expression = ast.GetAttributeExpression(context, symbol, 'to_flt')
+			self.assertTrue(expression.evaluate(None).is_nan(), "attribute {} failed".format(str_value))
 
 	def test_ast_expression_string_attributes_int(self):
 		tens = ('0b1010', '0o12', '10', '0xa', '1e1')
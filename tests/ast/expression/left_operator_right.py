@@ -33,6 +33,7 @@
 import datetime
 import functools
 import itertools
+import re
 import unittest
 
 from .literal import context, trueish, falseish
@@ -107,6 +108,13 @@ class ArithmeticExpressionTests(LeftOperatorRightExpresisonTestsBase):
 			with self.assertRaises(errors.EvaluationError):
 				self.assertExpressionTests(operation, ast.BooleanExpression(context, True), ast.FloatExpression(context, 4.0))
 
+	def test_ast_expression_left_operator_right_arithmetic_override(self):
+		class ArithmeticExpression(ast.ArithmeticExpression):
+			def _op_mul(self, thing):
+				return 0.0
+		expression = ArithmeticExpression(context, 'mul', ast.SymbolExpression(context, 'value'), self.two)
+		self.assertEqual(expression.evaluate({'value': 4.0}), 0.0)
+
 class AddExpressionTests(LeftOperatorRightExpresisonTestsBase):
 	ExpressionClass = ast.AddExpression
 	false_value = 0.0
@@ -364,6 +372,13 @@ class LogicExpressionTests(LeftOperatorRightExpresisonTestsBase):
 		for operator, left, right in itertools.product(('and', 'or'), falseish, falseish):
 			self.assertExpressionTests(operator, left, right, False)
 
+	def test_ast_expression_left_operator_right_logical_override(self):
+		class LogicExpression(ast.LogicExpression):
+			def _op_and(self, thing):
+				return True
+		expression = LogicExpression(context, 'and', ast.SymbolExpression(context, 'value'), ast.BooleanExpression(context, False))
+		self.assertTrue(expression.evaluate({'value': False}))
+
 ################################################################################
 # Left-Operator-Right Comparison Expressions
 ################################################################################
@@ -388,6 +403,22 @@ class ComparisonExpressionTests(LeftOperatorRightExpresisonTestsBase):
 		self.assertExpressionTests('ne', names1, names1, False)
 		self.assertExpressionTests('ne', names1, names2, True)
 
+	def test_ast_expression_left_operator_right_comparison_literal(self):
+		symbol = ast.SymbolExpression(context, 'value')
+		one = ast.FloatExpression(context, 1.0)
+		for value, result in ((1, True), (2, False), ('1', False), (None, False)):
+			expression = self.ExpressionClass(context, 'eq', symbol, one)
+			self.assertEqual(expression.evaluate({'value': value}), result)
+			expression = self.ExpressionClass(context, 'ne', symbol, one)
+			self.assertEqual(expression.evaluate({'value': value}), not result)
+
+	def test_ast_expression_left_operator_right_comparison_override(self):
+		class ComparisonExpression(ast.ComparisonExpression):
+			def _op_eq(self, thing):
+				return True
+		expression = ComparisonExpression(context, 'eq', ast.SymbolExpression(context, 'value'), ast.FloatExpression(context, 1.0))
+		self.assertTrue(expression.evaluate({'value': 2}))
+
 class ArithmeticComparisonExpressionTests(LeftOperatorRightExpresisonTestsBase):
 	ExpressionClass = ast.ArithmeticComparisonExpression
 	def test_ast_expression_left_operator_right_arithmeticcomparison_array(self):
@@ -455,6 +486,22 @@ class ArithmeticComparisonExpressionTests(LeftOperatorRightExpresisonTestsBase):
 		self.assertExpressionTests('le', string1, string2, False)
 		self.assertExpressionTests('lt', string1, string2, False)
 
+	def test_ast_expression_left_operator_right_arithmeticcomparison_literal(self):
+		symbol = ast.SymbolExpression(context, 'value')
+		one = ast.FloatExpression(context, 1.0)
+		for operation, value, result in (('ge', 1, True), ('gt', 1, False), ('le', 0, True), ('lt', 2, False)):
+			expression = self.ExpressionClass(context, operation, symbol, one)
+			self.assertEqual(expression.evaluate({'value': value}), result)
+		for value in ('1', None, (1,)):
+			expression = self.ExpressionClass(context, 'ge', symbol, one)
+			with self.assertRaises(errors.EvaluationError):
+				expression.evaluate({'value': value})
+		# a null constant is compared with the same semantics as any other value
+		expression = self.ExpressionClass(context, 'ge', symbol, ast.NullExpression(context))
+		self.assertTrue(expression.evaluate({'value': None}))
+		with self.assertRaises(errors.EvaluationError):
+			expression.evaluate({'value': 1})
+
 	def test_ast_expression_left_operator_right_arithmeticcomparison_type_errors(self):
 		for operation, left, right in itertools.product(('ge', 'gt', 'le', 'lt'), trueish, falseish):
 			if type(left) is type(right):
@@ -506,6 +553,19 @@ class FuzzyComparisonExpressionTests(LeftOperatorRightExpresisonTestsBase):
 		self.assertExpressionTests('ne_fzs', right_value=self.luke, equals_value=False)
 		self.assertExpressionTests('ne_fzs', right_value=darth, equals_value=True)
 
+	def test_ast_expression_left_operator_right_fuzzycomparison_literal_text(self):
+		symbol = ast.SymbolExpression(context, 'name')
+		patterns = ('', '^', '$', '^$', 'Luke', '^Luke', 'walker$', '^Skywalker$', 'Sky', 'sky', 'Sky.')
+		values = ('', '\n', 'Luke', 'Luke\n', 'xLuke', 'Skywalker', 'Skywalker\n', 'walker\nx')
+		for pattern, value in itertools.product(patterns, values):
+			for operation, regex_function in (('eq_fzm', re.match), ('eq_fzs', re.search)):
+				expression = self.ExpressionClass(context, operation, symbol, ast.StringExpression(context, pattern))
+				self.assertEqual(
+					expression.evaluate({'name': value}),
+					regex_function(pattern, value) is not None,
+					msg="{!r} {} {!r}".format(value, operation, pattern)
+				)
+
 	def test_ast_expression_left_operator_right_fuzzycomparison_type_errors(self):
 		operations = ('eq_fzm', 'eq_fzs', 'ne_fzm', 'ne_fzs')
 		for operation, left, right in itertools.product(operations, trueish, falseish):
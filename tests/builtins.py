@@ -230,3 +230,8 @@ class BuiltinsTests(unittest.TestCase):
 		self.assertIsInstance(owner_blts, builtins.Builtins)
 		self.assertEqual(owner_blts.namespace, 'people.owner')
 		self.assertEqual(owner_blts['name'], 'Spencer McIntyre')
+		self.assertIs(blts['owner'], owner_blts)
+
+		blts.timezone = dateutil.tz.tzutc()
+		self.assertIsNot(blts['owner'], owner_blts)
+		self.assertEqual(blts['owner'].timezone, blts.timezone)
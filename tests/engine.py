@@ -33,13 +33,18 @@
 import collections
 import datetime
 import decimal
+import gc
+import io
 import os
+import pickle
 import re
 import sys
 import types
 import unittest
+import weakref
 
 import rule_engine.ast as ast
+import rule_engine.builtins as builtins
 import rule_engine.engine as engine
 import rule_engine.errors as errors
 
@@ -90,6 +95,39 @@ class EngineTests(unittest.TestCase):
 		self.assertEqual(engine.resolve_item(thing, 'name'), thing['name'])
 		with self.assertRaises(errors.SymbolResolutionError):
 			engine.resolve_item(thing, 'email')
+		# missing items should not be created by mappings with default values
+		thing = collections.defaultdict(str, name='Alice')
+		with self.assertRaises(errors.SymbolResolutionError):
+			engine.resolve_item(thing, 'email')
+		self.assertNotIn('email', thing)
+		# subclasses overriding the lookup methods should have them used
+		class CaseInsensitiveDict(dict):
+			def __contains__(self, key):
+				return super(CaseInsensitiveDict, self).__contains__(key.lower())
+			def __getitem__(self, key):
+				return super(CaseInsensitiveDict, self).__getitem__(key.lower())
+		thing = CaseInsensitiveDict(name='Alice')
+		self.assertEqual(engine.resolve_item(thing, 'NAME'), 'Alice')
+		with self.assertRaises(errors.SymbolResolutionError):
+			engine.resolve_item(thing, 'EMAIL')
+
+	def test_engine_resolution_errors_pickle(self):
+		thing = {'name': 'Alice'}
+		type_resolver = engine.type_resolver_from_dict({'name': ast.DataType.STRING})
+		raisers = (
+			lambda: engine.resolve_attribute(types.SimpleNamespace(name='Alice'), 'nmae'),
+			lambda: engine.resolve_item(thing, 'nmae'),
+			lambda: type_resolver('nmae'),
+			lambda: engine.Rule('name.lenght').evaluate(thing)
+		)
+		for raiser in raisers:
+			with self.assertRaises((errors.AttributeResolutionError, errors.SymbolResolutionError)) as context:
+				raiser()
+			error = pickle.loads(pickle.dumps(context.exception))
+			self.assertIsInstance(error, context.exception.__class__)
+			self.assertEqual(error.message, context.exception.message)
+			self.assertIsNotNone(error.suggestion)
+			self.assertEqual(error.suggestion, context.exception.suggestion)
 
 	def test_engine_resolve_item_with_defaults(self):
 		thing = {'name': 'Alice'}
@@ -114,11 +152,67 @@ class EngineRuleTests(unittest.TestCase):
 	rule_text = 'first_name == "Luke" and email =~ ".*@rebels.org$"'
 	true_item = {'first_name': 'Luke', 'last_name': 'Skywalker', 'email': 'luke@rebels.org'}
 	false_item = {'first_name': 'Darth', 'last_name': 'Vader', 'email': 'dvader@empire.net'}
+	def test_engine_rule_decimal_context(self):
+		context = engine.Context(decimal_context=decimal.Context(prec=3))
+		rule = engine.Rule('value / 3', context=context)
+		self.assertEqual(rule.evaluate({'value': 1}), decimal.Decimal('0.333'))
+		# the result should be the same when the context is already the active one
+		with decimal.localcontext():
+			decimal.setcontext(context.decimal_context)
+			self.assertEqual(rule.evaluate({'value': 1}), decimal.Decimal('0.333'))
+		self.assertEqual(engine.Rule('value / 3').evaluate({'value': 1}), decimal.Decimal(1) / decimal.Decimal(3))
+		# the signal flags raised by the default context should not be set on the caller's context
+		with decimal.localcontext() as decimal_context:
+			decimal_context.clear_flags()
+			engine.Rule('value / 3').evaluate({'value': 1})
+			self.assertFalse(decimal_context.flags[decimal.Inexact])
+
+	def test_engine_rule_statement_cache(self):
+		context = engine.Context()
+		rule1 = engine.Rule(self.rule_text, context=context)
+		rule2 = engine.Rule(self.rule_text, context=context)
+		self.assertIs(rule1.statement, rule2.statement)
+		self.assertIsNot(rule1.statement, engine.Rule(self.rule_text).statement)
+		context.regex_flags = re.IGNORECASE
+		rule3 = engine.Rule(self.rule_text, context=context)
+		self.assertIsNot(rule1.statement, rule3.statement)
+		self.assertTrue(rule3.matches({'first_name': 'Luke', 'email': 'LUKE@REBELS.ORG'}))
+		self.assertIsNot(rule3.statement, engine.Rule(self.rule_text, context=context, cache=False).statement)
+		engine.Rule.clear_cache()
+		self.assertIsNot(rule3.statement, engine.Rule(self.rule_text, context=context).statement)
+
+	def test_engine_rule_statement_cache_builtins(self):
+		context = engine.Context()
+		self.assertIsInstance(engine.Rule('$pi + 1', context=context).evaluate(None), decimal.Decimal)
+		context.builtins = builtins.Builtins.from_defaults(values={'pi': 'pi'}, value_types={'pi': ast.DataType.STRING})
+		with self.assertRaises(errors.EvaluationError):
+			engine.Rule('$pi + 1', context=context)
+
+	def test_engine_rule_statement_cache_default_value(self):
+		context = engine.Context(default_value=None)
+		self.assertIsNone(engine.Rule('{"a": 1}.b', context=context).evaluate(None))
+		context.default_value = errors.UNDEFINED
+		with self.assertRaises(errors.AttributeResolutionError):
+			engine.Rule('{"a": 1}.b', context=context)
+
+	def test_engine_rule_statement_cache_releases_context(self):
+		context = engine.Context()
+		engine.Rule(self.rule_text, context=context)
+		context_ref = weakref.ref(context)
+		del context
+		gc.collect()
+		self.assertIsNone(context_ref())
+
 	def test_engine_rule_is_valid(self):
 		self.assertTrue(engine.Rule.is_valid(self.rule_text))
 		self.assertTrue(engine.Rule.is_valid('test == 1'))
 		self.assertFalse(engine.Rule.is_valid('test =='))
 
+	def test_engine_rule_is_valid_with_context(self):
+		self.assertTrue(engine.Rule.is_valid('test + 1'))
+		context = engine.Context(type_resolver={'test': ast.DataType.STRING})
+		self.assertFalse(engine.Rule.is_valid('test + 1', context=context))
+
 	def test_engine_rule_raises(self):
 		with self.assertRaises(errors.RuleSyntaxError):
 			engine.Rule('test ==')
@@ -189,7 +283,29 @@ class EngineRuleTests(unittest.TestCase):
 			original_stderr = sys.stderr
 			sys.stderr = file_h
 			debug_rule = engine.DebugRule(self.rule_text)
+			other_debug_rule = engine.DebugRule(self.rule_text)
+			sys.stderr = original_stderr
+		self.assertIs(debug_rule.parser, other_debug_rule.parser)
+		context = engine.Context()
+		for _ in range(2):
+			original_stderr = sys.stderr
+			sys.stderr = io.StringIO()
+			try:
+				engine.DebugRule(self.rule_text, context=context)
+				output = sys.stderr.getvalue()
+			finally:
+				sys.stderr = original_stderr
+			self.assertTrue(output)
+		# the parser itself only writes debug output while its tables are built
+		original_stderr = sys.stderr
+		sys.stderr = io.StringIO()
+		try:
+			debug_rule.parser.parse(self.rule_text, context)
+			output = sys.stderr.getvalue()
+		finally:
 			sys.stderr = original_stderr
+		self.assertEqual(output, '')
+		self.assertIsNot(debug_rule.parser, engine.Rule.parser)
 		self.test_engine_rule_matches(rule=debug_rule)
 		self.test_engine_rule_filter(rule=debug_rule)
 
@@ -30,10 +30,12 @@
 #  OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
 
+import collections
 import random
 import string
 import unittest
 
+import rule_engine.ast as ast
 import rule_engine.errors as errors
 
 class ResolutionErrorTests(unittest.TestCase):
@@ -55,6 +57,49 @@ class ResolutionErrorTests(unittest.TestCase):
 		self.assertIn('suggestion', repr(symbol_error))
 		self.assertIn(suggestion, repr(symbol_error))
 
+	def test_lazy_suggestion(self):
+		calls = []
+		def get_suggestion():
+			calls.append(None)
+			return 'doesexist'
+		for error in (
+				errors.AttributeResolutionError('doesnotexist', None, suggestion=get_suggestion),
+				errors.SymbolResolutionError('doesnotexist', suggestion=get_suggestion)
+			):
+			calls.clear()
+			self.assertEqual(len(calls), 0)
+			self.assertEqual(error.suggestion, 'doesexist')
+			self.assertEqual(error.suggestion, 'doesexist')
+			self.assertEqual(len(calls), 1)
+
+	def test_lazy_message(self):
+		calls = []
+		class ResolutionError(errors.SymbolResolutionError):
+			def _format_message(self):
+				calls.append(None)
+				return super(ResolutionError, self)._format_message()
+		error = ResolutionError('doesnotexist')
+		self.assertEqual(len(calls), 0)
+		self.assertEqual(error.message, "unknown symbol: 'doesnotexist'")
+		self.assertEqual(error.message, "unknown symbol: 'doesnotexist'")
+		self.assertEqual(len(calls), 1)
+
+	def test_type_error_messages(self):
+		attribute_error = errors.AttributeTypeError('name', ast.DataType.MAPPING, 1, ast.DataType.FLOAT, ast.DataType.STRING)
+		self.assertEqual(attribute_error.message, "attribute 'name' resolved to incorrect datatype (is: FLOAT, expected: STRING)")
+		symbol_error = errors.SymbolTypeError('name', 1, ast.DataType.FLOAT, ast.DataType.STRING)
+		self.assertEqual(symbol_error.message, "symbol 'name' resolved to incorrect datatype (is: FLOAT, expected: STRING)")
+		symbol_error.message = 'custom'
+		self.assertEqual(symbol_error.message, 'custom')
+
+class SyntaxErrorTests(unittest.TestCase):
+	def test_rule_syntax_error_message(self):
+		self.assertEqual(errors.RuleSyntaxError('syntax error').message, 'syntax error at: EOF')
+		token = collections.namedtuple('Token', ('lineno', 'lexpos'))(1, 4)
+		syntax_error = errors.RuleSyntaxError('syntax error', token)
+		self.assertIs(syntax_error.token, token)
+		self.assertEqual(syntax_error.message, 'syntax error at: line 1:4')
+
 class UndefinedSentinelTests(unittest.TestCase):
 	def test_undefined_has_a_repr(self):
 		self.assertEqual(repr(errors.UNDEFINED), 'UNDEFINED')
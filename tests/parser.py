@@ -32,11 +32,14 @@
 
 import datetime
 import decimal
+import gc
 import itertools
 import math
 import random
 import string
+import threading
 import unittest
+import weakref
 
 import rule_engine.ast as ast
 import rule_engine.engine as engine
@@ -60,6 +63,52 @@ class ParserTestsBase(unittest.TestCase):
 		return statement
 
 class ParserTests(ParserTestsBase):
+	def test_parser_builds_instance_lexers(self):
+		parser_ = parser.Parser()
+		self.assertIsNot(parser_._lexer, self._parser._lexer)
+		self.assertIs(parser_._lexer.lexmodule, parser_)
+		self.assertEqual(len(parser_._lexer.lexre), len(self._parser._lexer.lexre))
+		for _, rules in parser_._lexer.lexre:
+			for rule in rules:
+				if rule and rule[0] is not None:
+					self.assertIs(rule[0].__self__, parser_)
+		statement = parser_.parse('symbol == "string" and other < 2', engine.Context())
+		self.assertIsInstance(statement.expression, ast.LogicExpression)
+
+	def test_parser_lexer_template_releases_instance(self):
+		# the first instance of a class is used to build the shared template lexer, which must not keep it alive
+		class Parser(parser.Parser):
+			pass
+		parser_ = Parser()
+		parser_.parse('symbol == "string"', engine.Context())
+		parser_ref = weakref.ref(parser_)
+		del parser_
+		# ply keeps a module-level reference to the most recently built parser, so build another one
+		statement = Parser().parse('symbol == "string"', engine.Context())
+		self.assertIsInstance(statement.expression, ast.ComparisonExpression)
+		gc.collect()
+		self.assertIsNone(parser_ref())
+
+	def test_parser_concurrent_parsing(self):
+		parser_ = parser.Parser()
+		barrier = threading.Barrier(4)
+		results = {}
+		def parse(index):
+			barrier.wait()
+			for _ in range(25):
+				context = engine.Context()
+				statement = parser_.parse("symbol_{0} == {0} and other_{0} =~ 'x'".format(index), context)
+				results.setdefault(index, set()).add(tuple(sorted(context.symbols)))
+			results[index].add(type(statement.expression))
+		threads = [threading.Thread(target=parse, args=(index,)) for index in range(4)]
+		for thread in threads:
+			thread.start()
+		for thread in threads:
+			thread.join()
+		for index in range(4):
+			self.assertEqual(results[index], {('other_' + str(index), 'symbol_' + str(index)), ast.LogicExpression})
+		self.assertIsNone(parser_.context)
+
 	def test_parser_comment_expressions(self):
 		expression = self.assertStatementType('null', ast.NullExpression)
 		self.assertIsNone(expression.comment)
@@ -161,6 +210,13 @@ class ParserTests(ParserTestsBase):
 		with self.assertRaises(errors.RuleSyntaxError):
 			self._parse('test[', self.context)
 
+	def test_parser_syntax_error_line_numbers(self):
+		self._parse('test ==\n\nother', engine.Context())
+		for text, lineno in (('test @', 1), ('test ==\n  @', 2), ('test\n\nother', 3)):
+			with self.assertRaises(errors.RuleSyntaxError) as context:
+				self._parse(text, engine.Context())
+			self.assertEqual(context.exception.token.lineno, lineno)
+
 	def test_parser_reserved_keywords(self):
 		keywords = ('elif', 'else', 'while')
 		for keyword in keywords: